@@ -1,3 +1,112 @@
+import mmap
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+CHUNK_SIZE = 64 * 1024 * 1024  # bytes per chunk, and per worker task
+# Bytes per numpy operation: the temporaries (bool masks, 8-byte ints in bincount) stay this small
+BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def _is_continuation(byte):
+    return byte & 0xC0 == 0x80  # 10xxxxxx: the middle of a multibyte UTF-8 character
+
+
+def _chunk_bounds(file_path, chunk_size=CHUNK_SIZE):
+    # (start, end) byte ranges covering the file. Each boundary is moved forward past UTF-8 continuation
+    # bytes, so no character is split between two chunks and each one is counted exactly once.
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(file_path, "rb") as data, mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        position = chunk_size
+        while position < size:
+            while position < size and _is_continuation(view[position]):
+                position += 1
+            if position < size:
+                bounds.append(position)
+            position += chunk_size
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _count_in_chunk(file_path, start, end, needle):
+    # Runs in the worker processes, so it maps the file itself rather than receiving the data
+    with open(file_path, "rb") as data, mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return _count_in_view(view, start, end, needle)
+
+
+def _count_in_view(view, start, end, needle):
+    # Occurrences of needle starting in [start, end), compared in place on the mapped pages: byte j of
+    # the needle is checked against a view shifted by j, so nothing is copied out of the file.
+    # The arrays are local, so they are gone before the caller closes the mmap.
+    import numpy as np
+
+    data = np.frombuffer(view, dtype=np.uint8)
+    pattern = np.frombuffer(needle, dtype=np.uint8)
+    count = 0
+    for block_start in range(start, end, BLOCK_SIZE):
+        # Positions whose whole needle fits in the file; a match may run past the block end
+        positions = min(block_start + BLOCK_SIZE, end, len(data) - len(needle) + 1) - block_start
+        if positions <= 0:
+            break
+        matches = data[block_start:block_start + positions] == pattern[0]
+        for offset in range(1, len(needle)):
+            matches &= data[block_start + offset:block_start + offset + positions] == pattern[offset]
+        count += int(np.count_nonzero(matches))
+    return count
+
+
+def _histogram_chunk(file_path, start, end, wide_chars):
+    # Byte counts of the chunk, plus counts of multibyte characters: all of them when wide_chars is None,
+    # otherwise only those listed. ASCII characters are single bytes, so the byte counts already cover them.
+    with open(file_path, "rb") as data, mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return _histogram_view(view, start, end, wide_chars)
+
+
+def _histogram_view(view, start, end, wide_chars):
+    # One pass over each block: bincount for the bytes, and the code points of the multibyte characters
+    # that start in it, decoded with array operations rather than a Python loop or a regex over the text.
+    import numpy as np
+
+    data = np.frombuffer(view, dtype=np.uint8)
+    wanted = None if wide_chars is None else np.array([ord(char) for char in wide_chars], dtype=np.int64)
+    counts = np.zeros(256, dtype=np.int64)
+    wide = Counter()
+    for block_start in range(start, end, BLOCK_SIZE):
+        block = data[block_start:min(block_start + BLOCK_SIZE, end)]
+        counts += np.bincount(block, minlength=256)
+        if wanted is not None and not len(wanted):
+            continue
+        code_points = _code_points(data, block_start + np.flatnonzero(block >= 0xC2))
+        if wanted is not None:
+            code_points = code_points[np.isin(code_points, wanted)]
+        if len(code_points):
+            values, occurrences = np.unique(code_points, return_counts=True)
+            wide.update(dict(zip(map(chr, values.tolist()), occurrences.tolist())))
+    return counts, wide
+
+
+def _code_points(data, positions):
+    # Code points of the UTF-8 sequences starting at positions (lead bytes 0xC2-0xF4);
+    # sequences with a missing or wrong continuation byte are dropped
+    import numpy as np
+
+    lead = data[positions].astype(np.int64)
+    width = np.where(lead >= 0xF0, 4, np.where(lead >= 0xE0, 3, 2))
+    code_points = lead & np.where(width == 2, 0x1F, np.where(width == 3, 0x0F, 0x07))
+    valid = lead <= 0xF4
+    for offset in (1, 2, 3):
+        needed = width > offset
+        index = positions + offset
+        byte = data[np.minimum(index, len(data) - 1)].astype(np.int64)
+        valid &= ~needed | ((index < len(data)) & (byte & 0xC0 == 0x80))
+        code_points = np.where(needed, (code_points << 6) | (byte & 0x3F), code_points)
+    return code_points[valid]
+
+
 class FileReader:
     def __init__(self, file_path):
         self.file_path = file_path
@@ -9,15 +118,48 @@ class FileReader:
                 print(line[0:-1])
         data.close()
 
-    def find_char_count(self, character):
-        count = 0
-        with open(self.file_path, "r", encoding="utf-8") as data:
-            lines = data.readlines()
-            for line in lines:
-                if "*" in line:
-                    count += line.count("*")
-        data.close()
-        return count
+    def find_char_count(self, character, workers=None):
+        # Counts one character (str) or one byte (bytes) over a memory map, CHUNK_SIZE bytes at a time.
+        # A character is matched by its UTF-8 bytes. Files bigger than one chunk are split across a process pool.
+        if len(character) != 1:
+            raise ValueError("character must be a single character or byte")
+        needle = character.encode("utf-8") if isinstance(character, str) else bytes(character)
+        return sum(self._map_chunks(_count_in_chunk, needle, workers=workers))
+
+    def byte_histogram(self, workers=None):
+        # Occurrences of each byte value 0-255 as a numpy array, in one pass over the file
+        import numpy as np
+
+        total = np.zeros(256, dtype=np.int64)
+        for counts, _ in self._map_chunks(_histogram_chunk, (), workers=workers):
+            total += counts
+        return total
+
+    def char_histogram(self, chars=None, workers=None):
+        # {character: count} in one pass over the file, for every character in it (chars=None)
+        # or for each of the given characters, including those that do not occur
+        import numpy as np
+
+        wanted = None if chars is None else list(dict.fromkeys(chars))
+        wide_chars = None if wanted is None else tuple(char for char in wanted if ord(char) > 0x7F)
+        counts = np.zeros(256, dtype=np.int64)
+        wide = Counter()
+        for chunk_counts, chunk_wide in self._map_chunks(_histogram_chunk, wide_chars, workers=workers):
+            counts += chunk_counts
+            wide.update(chunk_wide)
+        if wanted is None:
+            histogram = {chr(byte): int(counts[byte]) for byte in np.flatnonzero(counts[:0x80])}
+            histogram.update(wide)
+            return histogram
+        return {char: int(counts[ord(char)]) if ord(char) <= 0x7F else wide[char] for char in wanted}
+
+    def _map_chunks(self, function, *args, workers=None):
+        # function(file_path, start, end, *args) for every chunk; in a process pool when there are several chunks
+        chunks = _chunk_bounds(self.file_path)
+        if len(chunks) <= 1 or workers == 1:
+            return [function(self.file_path, start, end, *args) for start, end in chunks]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(function, repeat(self.file_path), *zip(*chunks), *(repeat(arg) for arg in args)))
 
     def add_content(self, content):
         with open(self.file_path, "a") as data:
@@ -0,0 +1,190 @@
+# Author: Oshan Mendis
+# Date: 2026-10-16
+# Description: asyncio facade for CollegeDatabase
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from CollegeDatabase import DEFAULT_PROFILE, FETCH_BATCH_SIZE, CollegeDatabase
+
+# The AsyncCollegeDatabase whose transaction() the current task is inside, if any
+_transaction_owner = contextvars.ContextVar("transaction_owner", default=None)
+
+
+class AsyncCollegeDatabase:
+    """
+    Coroutine versions of the CollegeDatabase methods, so an asyncio server never
+    blocks its event loop on disk I/O.
+
+    The connection lives on one dedicated worker thread and every call runs there
+    in order, which is all the serialisation one SQLite connection needs.
+    While a task is inside `async with db.transaction():` calls from other tasks wait,
+    so they cannot end up inside someone else's transaction. Tasks created inside
+    the block inherit it and run as part of the transaction.
+
+        db = AsyncCollegeDatabase("yoobee_college.db")
+        count = await db.count_students_in_course("MSE800")
+        async for row in db.iter_all("student_course", as_rows=True):
+            ...
+        await db.close()
+    """
+
+    def __init__(self, db_name, profile: str = DEFAULT_PROFILE, **options):
+        """options are passed to CollegeDatabase, e.g. query_cache_size=1024."""
+        self.db_name = db_name
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="college-db")
+        # sqlite3 connections belong to the thread that opened them, so open it on the worker
+        self._database = self._executor.submit(CollegeDatabase, db_name, profile, **options)
+        self._lock = asyncio.Lock()
+
+    async def _call(self, method: str, *args, **kwargs) -> Any:
+        return await self._call_function(lambda: getattr(self._database.result(), method)(*args, **kwargs))
+
+    async def _call_function(self, function) -> Any:
+        if _transaction_owner.get() is self:
+            return await self._run_on_worker(function)
+        async with self._lock:
+            return await self._run_on_worker(function)
+
+    async def _run_on_worker(self, function) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function)
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Async version of CollegeDatabase.transaction(); nested blocks use savepoints."""
+        if _transaction_owner.get() is self:
+            # Nested block in the task that already holds the lock
+            async with self._transaction_block():
+                yield self
+            return
+
+        async with self._lock:
+            token = _transaction_owner.set(self)
+            try:
+                async with self._transaction_block():
+                    yield self
+            finally:
+                _transaction_owner.reset(token)
+
+    @asynccontextmanager
+    async def _transaction_block(self):
+        block = await self._run_on_worker(lambda: self._database.result().transaction())
+        await self._run_on_worker(block.__enter__)
+        try:
+            yield
+        except BaseException as e:
+            await self._run_on_worker(partial(block.__exit__, type(e), e, e.__traceback__))
+            raise
+        await self._run_on_worker(partial(block.__exit__, None, None, None))
+
+    async def in_transaction(self) -> bool:
+        """
+        CollegeDatabase.in_transaction(). Only True for the task inside the transaction() block
+        (and tasks it created); other tasks wait for the block to end before this runs.
+        """
+        return await self._call("in_transaction")
+
+    async def pool_stats(self) -> Optional[Dict[str, Any]]:
+        return await self._call("pool_stats")
+
+    async def instrument(self, sink=None, slow_query_ms: Optional[float] = None, slow_query_sink=None) -> None:
+        """
+        CollegeDatabase.instrument(). The sinks are called on the worker thread, and an event's
+        caller is the line in this module that forwarded the call, not the awaiting coroutine.
+        """
+        return await self._call("instrument", sink, slow_query_ms, slow_query_sink)
+
+    async def set_profile(self, profile: str) -> None:
+        return await self._call("set_profile", profile)
+
+    async def profile_report(self) -> Dict[str, Any]:
+        return await self._call("profile_report")
+
+    async def create_table(self, table_name, columns: dict,
+                           indexes: Optional[List[Union[str, Tuple[str, ...]]]] = None) -> None:
+        return await self._call("create_table", table_name, columns, indexes)
+
+    async def explain(self, sql: str, params: Tuple = ()) -> List[str]:
+        return await self._call("explain", sql, params)
+
+    async def insert_record(self, table_name: str, data: Dict[str, Any]) -> None:
+        return await self._call("insert_record", table_name, data)
+
+    async def insert_many(self, table_name: str, rows: Union[Iterable[Dict[str, Any]], TextIO],
+                          batch_size: int = 1000) -> int:
+        """rows is read on the worker thread, so a lazy iterable or file must not need the event loop."""
+        return await self._call("insert_many", table_name, rows, batch_size)
+
+    async def fetch_all(self, table_name: str) -> List[Tuple]:
+        return await self._call("fetch_all", table_name)
+
+    async def fetch_by_condition(self, table_name: str, condition: str, params: Tuple = ()) -> List[Tuple]:
+        return await self._call("fetch_by_condition", table_name, condition, params)
+
+    async def iter_all(self, table_name: str, batch_size: int = FETCH_BATCH_SIZE,
+                       as_rows: bool = False) -> AsyncIterator[Tuple]:
+        """Async iteration over a table; each batch of batch_size rows is one trip to the worker thread."""
+        async for row in self._iterate("iter_all", table_name, batch_size=batch_size, as_rows=as_rows):
+            yield row
+
+    async def iter_where(self, table_name: str, condition: str, params: Tuple = (),
+                         batch_size: int = FETCH_BATCH_SIZE, as_rows: bool = False) -> AsyncIterator[Tuple]:
+        async for row in self._iterate("iter_where", table_name, condition, params,
+                                       batch_size=batch_size, as_rows=as_rows):
+            yield row
+
+    async def _iterate(self, method: str, *args, batch_size: int, **kwargs) -> AsyncIterator[Tuple]:
+        rows = await self._call(method, *args, batch_size=batch_size, **kwargs)  # creates the generator, no query yet
+        try:
+            while True:
+                batch = await self._call_function(lambda: list(islice(rows, batch_size)))
+                if not batch:
+                    return
+                for row in batch:
+                    yield row
+        finally:
+            await self._call_function(rows.close)
+
+    async def page_after(self, table_name: str, last_id: Optional[Any] = None, limit: int = 100,
+                         key: str = "id", as_rows: bool = False) -> List[Tuple]:
+        return await self._call("page_after", table_name, last_id, limit, key, as_rows)
+
+    async def update_record(self, table_name: str, update_data: Dict[str, Any], condition: str,
+                            params: Tuple) -> None:
+        return await self._call("update_record", table_name, update_data, condition, params)
+
+    async def delete_record_by_condition(self, table_name: str, condition: str, params: Tuple) -> None:
+        return await self._call("delete_record_by_condition", table_name, condition, params)
+
+    async def count_students_in_course(self, course_code: str) -> int:
+        return await self._call("count_students_in_course", course_code)
+
+    async def list_teachers_for_course(self, course_code: str) -> list:
+        return await self._call("list_teachers_for_course", course_code)
+
+    async def enable_course_stats(self) -> None:
+        await self._call("enable_course_stats")
+
+    async def check_course_stats(self) -> List[Tuple[int, Tuple[int, int], Tuple[int, int]]]:
+        return await self._call("check_course_stats")
+
+    async def rebuild_course_stats(self) -> None:
+        await self._call("rebuild_course_stats")
+
+    async def query_cache_stats(self) -> Optional[Dict[str, Any]]:
+        return await self._call("query_cache_stats")
+
+    async def close(self) -> None:
+        await self._call("close")
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -2,82 +2,993 @@
 # Date: 2025-12-12
 # Description: College Database CRUD program
 
+import contextlib
+import csv
+import inspect
+import queue
+import re
 import sqlite3
-from typing import Dict, List, Tuple, Any, Optional
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import closing, contextmanager
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Dict, List, Tuple, Any, Optional, Iterable, Iterator, Union, TextIO
+
+# Named performance profiles, applied as PRAGMAs when the connection is opened.
+# cache_size is in KiB when negative, mmap_size in bytes, busy_timeout in milliseconds.
+PROFILES = {
+    # SQLite defaults: rollback journal and an fsync on every commit, safest against power loss
+    "durable": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    # WAL lets readers run alongside a writer; a power cut can lose the last commits, never corrupt
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # For one-off imports only: no fsync at all, a crash mid-load can corrupt the database
+    "bulk-load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+DEFAULT_PROFILE = "durable"
+
+# explain() warns when a query scans a table with at least this many rows
+LARGE_TABLE_ROWS = 10_000
+
+# Rows fetched per fetchmany() call by the iter_* methods
+FETCH_BATCH_SIZE = 1000
+
+# Seconds a thread waits for a free pooled connection before giving up
+POOL_TIMEOUT = 30.0
+
+# Prepared statements kept per connection by sqlite3 (its own default is 128)
+CACHED_STATEMENTS = 256
+
+# Generated CRUD statements memoised by _build_sql
+SQL_CACHE_SIZE = 1024
+
+# Default lifetime of a query_cache entry in seconds; bounds staleness from writes made by other processes
+QUERY_CACHE_TTL = 60.0
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Join tables counted in course_stats: (table, member column, counter column)
+COURSE_STATS_COUNTERS = (
+    ("student_course", "student_id", "student_count"),
+    ("teacher_course", "teacher_id", "teacher_count"),
+)
+
+# Triggers keeping one course_stats counter exact. A member is counted once per course
+# however many duplicate rows it has, matching COUNT(DISTINCT ...).
+_COURSE_STATS_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS {table}_stats_insert AFTER INSERT ON {table}
+WHEN NEW.course_id IS NOT NULL AND NEW.{member} IS NOT NULL
+ AND (SELECT COUNT(*) FROM {table} WHERE course_id = NEW.course_id AND {member} = NEW.{member}) = 1
+BEGIN
+    INSERT INTO course_stats (course_id, {counter}) VALUES (NEW.course_id, 1)
+    ON CONFLICT (course_id) DO UPDATE SET {counter} = {counter} + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_stats_delete AFTER DELETE ON {table}
+WHEN OLD.course_id IS NOT NULL AND OLD.{member} IS NOT NULL
+ AND NOT EXISTS (SELECT 1 FROM {table} WHERE course_id = OLD.course_id AND {member} = OLD.{member})
+BEGIN
+    UPDATE course_stats SET {counter} = {counter} - 1 WHERE course_id = OLD.course_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_stats_update_old AFTER UPDATE OF course_id, {member} ON {table}
+WHEN (OLD.course_id IS NOT NEW.course_id OR OLD.{member} IS NOT NEW.{member})
+ AND OLD.course_id IS NOT NULL AND OLD.{member} IS NOT NULL
+ AND NOT EXISTS (SELECT 1 FROM {table} WHERE course_id = OLD.course_id AND {member} = OLD.{member})
+BEGIN
+    UPDATE course_stats SET {counter} = {counter} - 1 WHERE course_id = OLD.course_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_stats_update_new AFTER UPDATE OF course_id, {member} ON {table}
+WHEN (OLD.course_id IS NOT NEW.course_id OR OLD.{member} IS NOT NEW.{member})
+ AND NEW.course_id IS NOT NULL AND NEW.{member} IS NOT NULL
+ AND (SELECT COUNT(*) FROM {table} WHERE course_id = NEW.course_id AND {member} = NEW.{member}) = 1
+BEGIN
+    INSERT INTO course_stats (course_id, {counter}) VALUES (NEW.course_id, 1)
+    ON CONFLICT (course_id) DO UPDATE SET {counter} = {counter} + 1;
+END;
+"""
+
+_FOREIGN_KEY = re.compile(r"FOREIGN\s+KEY\s*\(([^)]*)\)", re.IGNORECASE)
+_TABLE_REFERENCE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+_SQL_KEYWORDS = {"WHERE", "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "CROSS", "NATURAL", "ON", "USING",
+                 "GROUP", "ORDER", "LIMIT", "HAVING", "UNION", "EXCEPT", "INTERSECT", "WINDOW"}
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Validate a table or column name and return it double-quoted for SQL.
+    Only plain names (letters, digits, underscores) are accepted, so a name can
+    never carry SQL of its own into a generated statement.
+    """
+    if not isinstance(name, str) or not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return f'"{name}"'
+
+
+@lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_sql(operation: str, table_name: str, columns: Tuple[str, ...] = (),
+               condition: Optional[str] = None) -> str:
+    """
+    SQL text for the CRUD builders, memoised by (operation, table, columns, condition).
+    Identical text also lets sqlite3 reuse its prepared statement.
+    """
+    table = quote_identifier(table_name)
+    if operation == "insert":
+        placeholders = ", ".join(["?" for _ in columns])
+        return f"INSERT INTO {table} ({', '.join(map(quote_identifier, columns))}) VALUES ({placeholders})"
+    if operation == "update":
+        set_clause = ", ".join([f"{quote_identifier(col)} = ?" for col in columns])
+        return f"UPDATE {table} SET {set_clause} WHERE {condition}"
+    if operation == "select":
+        return f"SELECT * FROM {table}" if condition is None else f"SELECT * FROM {table} WHERE {condition}"
+    if operation == "delete":
+        return f"DELETE FROM {table} WHERE {condition}"
+    raise ValueError(f"Unknown SQL operation: {operation}")
+
+
+def _not_timed(sql: str):
+    return _NOT_TIMED
+
+
+def _apply_profile(conn: sqlite3.Connection, profile: str, wal: bool = False, timed=_not_timed) -> None:
+    # timed: CollegeDatabase._timed when the statements should reach instrument()
+    for pragma, value in PROFILES[profile].items():
+        if wal and pragma == "journal_mode":
+            value = "WAL"
+        with timed(f"PRAGMA {pragma} = {value}"):
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+class ConnectionPool:
+    """
+    A fixed number of SQLite connections shared by many threads.
+    Each connection is used by one thread at a time; threads beyond `size`
+    wait in acquire() and the time they spend waiting is recorded.
+    Connections always use WAL, so readers are not blocked by the writer.
+    """
+
+    def __init__(self, db_name, size: int = 8, profile: str = DEFAULT_PROFILE, timeout: float = POOL_TIMEOUT,
+                 cached_statements: int = CACHED_STATEMENTS, timed=_not_timed):
+        self.db_name = db_name
+        self.size = size
+        self.cached_statements = cached_statements
+        self.profile = profile
+        self.timeout = timeout
+        self._timed = timed  # see _apply_profile
+        self._idle = queue.LifoQueue()  # most recently used first, its pages are still cached
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._connections = []
+        self._profiles = {}  # profile each connection was last configured with
+        self._stats = {"checkouts": 0, "waits": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0, "in_use": 0}
+
+    def acquire(self) -> sqlite3.Connection:
+        start = time.perf_counter()
+        waited = not self._slots.acquire(blocking=False)
+        if waited and not self._slots.acquire(timeout=self.timeout):
+            raise sqlite3.OperationalError(f"Timed out after {self.timeout}s waiting for a pooled connection")
+        wait = time.perf_counter() - start
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            # Connections are created lazily and handed between threads, never shared at once
+            conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+            with self._lock:
+                self._connections.append(conn)
+        if self._profiles.get(conn) != self.profile:
+            _apply_profile(conn, self.profile, wal=True, timed=self._timed)
+            self._profiles[conn] = self.profile
+
+        with self._lock:
+            self._stats["checkouts"] += 1
+            self._stats["in_use"] += 1
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += wait
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            with self._timed("ROLLBACK"):
+                conn.rollback()  # never hand an open transaction to the next thread
+        with self._lock:
+            self._stats["in_use"] -= 1
+        self._idle.put(conn)
+        self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Checkouts, how many had to wait for a free connection, and for how long."""
+        with self._lock:
+            report = dict(self._stats, size=self.size, created=len(self._connections))
+        report["mean_wait_seconds"] = report["wait_seconds"] / report["waits"] if report["waits"] else 0.0
+        return report
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+class QueryCache:
+    """
+    In-process LRU cache of read query results with a TTL.
+
+    Each entry records the tables its query reads, and a write to a table drops
+    exactly the entries that read it. Per-table generation counters stop a read
+    that overlapped a write from caching its now-stale result.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = QUERY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires, value, tables), oldest first
+        self._keys_by_table = {}
+        self._generations = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key) -> Tuple[bool, Any]:
+        """Returns (True, value) on a hit, (False, None) otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                self._stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, entry[1]
+
+    def generation(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in tables)
+
+    def put(self, key, value, tables: Tuple[str, ...], generation: Tuple[int, ...]) -> None:
+        """Stores value unless one of its tables was written since generation() was read."""
+        with self._lock:
+            if generation != tuple(self._generations.get(table, 0) for table in tables):
+                return
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, tables)
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def invalidate(self, *tables: str) -> None:
+        with self._lock:
+            for table in tables:
+                table = table.lower()
+                self._generations[table] = self._generations.get(table, 0) + 1
+                for key in list(self._keys_by_table.get(table, ())):
+                    self._remove(key)
+                    self._stats["invalidations"] += 1
+
+    def _remove(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            for table in entry[2]:
+                self._keys_by_table[table].discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            report = dict(self._stats, entries=len(self._entries), max_entries=self.max_entries, ttl=self.ttl)
+        lookups = report["hits"] + report["misses"]
+        report["hit_ratio"] = report["hits"] / lookups if lookups else 0.0
+        return report
+
+
+@lru_cache(maxsize=SQL_CACHE_SIZE)
+def _sql_template(sql: str) -> str:
+    # One line per statement, so the same query always has the same key in metrics
+    return " ".join(sql.split())
+
+
+def _call_site(frame) -> Optional[str]:
+    """file:line of the first frame outside this module and contextlib."""
+    while frame is not None and frame.f_code.co_filename in (__file__, contextlib.__file__):
+        frame = frame.f_back
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}" if frame is not None else None
+
+
+class _QueryTimer:
+    """Times one statement for CollegeDatabase.instrument(); the caller sets event["rows"]."""
+
+    __slots__ = ("database", "event", "start")
+
+    def __init__(self, database, sql: str):
+        self.database = database
+        self.event = {"sql": _sql_template(sql), "rows": None}
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.start = time.perf_counter()
+        return self.event
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.event["seconds"] = time.perf_counter() - self.start
+        if exc is not None:
+            self.event["error"] = f"{exc_type.__name__}: {exc}"
+        self.database._record(self.event)
+
+
+class _NotTimed:
+    """
+    Stand-in for _QueryTimer while instrumentation is off, so the hot paths stay cheap.
+    Holds no state, so one instance is shared by all threads; each block gets a throwaway event.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> Dict[str, Any]:
+        return {}
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+
+_NOT_TIMED = _NotTimed()
+
+
+def _records_call(method):
+    """
+    While instrumentation is on, note the method name and the file:line that called it once per call,
+    for the events of every statement it runs. Calls made inside another such method keep the outer one.
+    """
+    name = method.__name__
+    if inspect.isgeneratorfunction(method):
+        @wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            if not self._timing() or getattr(self._local, "call", None) is not None:
+                return (yield from method(self, *args, **kwargs))
+            call = (name, _call_site(sys._getframe(1)))
+            return (yield from self._run_as_call(method(self, *args, **kwargs), call))
+        return generator_wrapper
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._timing() or getattr(self._local, "call", None) is not None:
+            return method(self, *args, **kwargs)
+        self._local.call = (name, _call_site(sys._getframe(1)))
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._local.call = None
+    return wrapper
+
+
+def _uses_connection(method):
+    """
+    In pooled mode, check out a connection for the calling thread around the method
+    (for generators: until the caller stops iterating). Calls made while the thread
+    already holds one, e.g. inside transaction(), reuse it.
+    """
+    if inspect.isgeneratorfunction(method):
+        @wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            with self.connection():
+                yield from method(self, *args, **kwargs)
+        return _records_call(generator_wrapper)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._pool is None:
+            return method(self, *args, **kwargs)
+        with self.connection():
+            return method(self, *args, **kwargs)
+    return _records_call(wrapper)
 
 
 class CollegeDatabase:
-    def __init__(self, db_name):
+    def __init__(self, db_name, profile: str = DEFAULT_PROFILE, pool_size: Optional[int] = None,
+                 cached_statements: int = CACHED_STATEMENTS, cache_sql: bool = True,
+                 query_cache_size: int = 0, query_cache_ttl: float = QUERY_CACHE_TTL):
+        """
+        db_name: SQLite database file
+        profile: one of PROFILES
+        pool_size: if set, use a ConnectionPool of this many connections so the object
+                   can be shared by threads (e.g. a web server); each thread gets its
+                   own connection and cursor for the duration of a call
+        cached_statements: prepared statements sqlite3 keeps per connection
+        cache_sql: memoise the SQL text built by the CRUD methods
+        query_cache_size: if > 0, cache up to this many results of count_students_in_course
+                          and list_teachers_for_course for query_cache_ttl seconds
+        """
         self.db_name = db_name  # Setting the db name
-        self.conn = sqlite3.connect(self.db_name)  # Connecting to database
-        self.cursor = self.conn.cursor()  # Setting the cursor to run SQL queries
+        self._local = threading.local()  # Per-thread connection, cursor and transaction depth
+        self._row_types = {}  # namedtuple classes by column names, for as_rows=True
+        self._build_sql = _build_sql if cache_sql else _build_sql.__wrapped__
+        self.query_cache = QueryCache(query_cache_size, query_cache_ttl) if query_cache_size > 0 else None
+        self._course_stats_enabled = None  # looked up on first use, see enable_course_stats()
+        self._metrics_sink = None
+        self._slow_query_seconds = None
+        self._slow_query_sink = None
+        self.profile = None
+        if pool_size is None:
+            self._pool = None
+            self._conn = sqlite3.connect(self.db_name, cached_statements=cached_statements)  # Connecting to database
+            self._cursor = self._conn.cursor()  # Setting the cursor to run SQL queries
+        else:
+            if db_name == ":memory:":
+                raise ValueError("Pooled mode needs a database file; each :memory: connection is a separate database")
+            self._pool = ConnectionPool(db_name, pool_size, profile, cached_statements=cached_statements,
+                                        timed=self._timed)
+        self.set_profile(profile)
+
+    def instrument(self, sink=None, slow_query_ms: Optional[float] = None, slow_query_sink=None) -> None:
+        """
+        Time every statement the CRUD methods run, plus commits.
+        Each one becomes an event dict: sql (the template, with ? placeholders), seconds,
+        rows (returned or affected, when known), method (the CollegeDatabase method), caller
+        (file:line outside this module), timestamp, and error if it failed.
+
+        sink: receives every event through sink.record(event), e.g. a QueryMetrics.HistogramSink
+              or QueryMetrics.JsonLinesSink
+        slow_query_ms: events at least this slow also go to slow_query_sink, or are printed
+                       when there is none
+        Call instrument() with no arguments to switch timing off again.
+        """
+        self._metrics_sink = sink
+        self._slow_query_seconds = slow_query_ms / 1000 if slow_query_ms is not None else None
+        self._slow_query_sink = slow_query_sink
+
+    def _timing(self) -> bool:
+        return self._metrics_sink is not None or self._slow_query_seconds is not None
+
+    def _timed(self, sql: str):
+        if not self._timing():
+            return _NOT_TIMED
+        return _QueryTimer(self, sql)
+
+    def _run_as_call(self, generator: Iterator, call: Tuple[str, Optional[str]]):
+        """
+        Run a generator method with its call noted only while its own code runs, not while the
+        consumer does between items (the consumer may call other methods). Forwards send/throw/close,
+        so it also works under @contextmanager.
+        """
+        resume, value = generator.send, None
+        while True:
+            outer, self._local.call = getattr(self._local, "call", None), call
+            try:
+                item = resume(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._local.call = outer
+            try:
+                value = yield item
+                resume = generator.send
+            except GeneratorExit:
+                outer, self._local.call = getattr(self._local, "call", None), call
+                try:
+                    generator.close()
+                finally:
+                    self._local.call = outer
+                raise
+            except BaseException as e:
+                resume, value = generator.throw, e
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        # Statements run outside any public method (e.g. by CollegeExport) only get the caller's file:line
+        event["method"], event["caller"] = getattr(self._local, "call", None) or (None, _call_site(sys._getframe(1)))
+        event["timestamp"] = time.time()
+        if self._metrics_sink is not None:
+            self._metrics_sink.record(event)
+        if self._slow_query_seconds is not None and event["seconds"] >= self._slow_query_seconds:
+            if self._slow_query_sink is not None:
+                self._slow_query_sink.record(event)
+            else:
+                print(f"Slow query ({event['seconds'] * 1000:.1f} ms, {event['method']} from {event['caller']}): "
+                      f"{event['sql']}")
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._pool is None:
+            return self._conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            raise RuntimeError("No pooled connection checked out by this thread; use `with db.connection():`")
+        return conn
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        if self._pool is None:
+            return self._cursor
+        self.conn  # raises if no connection is checked out
+        return self._local.cursor
+
+    @contextmanager
+    def connection(self):
+        """
+        Hold one pooled connection for the calling thread for the whole block, so several
+        calls share it. Without a pool this just yields the single connection.
+        """
+        if self._pool is None or getattr(self._local, "conn", None) is not None:
+            yield self.conn
+            return
+
+        conn = self._pool.acquire()
+        self._local.conn = conn
+        self._local.cursor = conn.cursor()
+        try:
+            yield conn
+        finally:
+            self._local.cursor.close()
+            self._local.conn = self._local.cursor = None
+            self._pool.release(conn)
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """ConnectionPool.stats() in pooled mode, otherwise None."""
+        return self._pool.stats() if self._pool is not None else None
+
+    @property
+    def _transaction_depth(self) -> int:
+        return getattr(self._local, "transaction_depth", 0)  # Number of open transaction() blocks
+
+    @_transaction_depth.setter
+    def _transaction_depth(self, depth: int) -> None:
+        self._local.transaction_depth = depth
+
+    @_records_call
+    def set_profile(self, profile: str) -> None:
+        """
+        Apply one of the named PROFILES ("durable", "balanced" or "bulk-load").
+        Switch back to "durable" or "balanced" after a bulk load; the journal mode
+        can only be changed outside a transaction.
+        In pooled mode the profile is applied to each connection as it is checked out,
+        always with WAL journaling.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile '{profile}', expected one of: {', '.join(PROFILES)}")
+        if self.in_transaction():
+            raise sqlite3.OperationalError("Cannot change the profile inside a transaction")
 
-    def create_table(self, table_name, columns: dict):
+        if self._pool is None:
+            _apply_profile(self.conn, profile, timed=self._timed)
+        else:
+            self._pool.profile = profile
+        self.profile = profile
+
+    @_uses_connection
+    def profile_report(self) -> Dict[str, Any]:
+        """
+        Return the active profile name and the PRAGMA values SQLite actually reports.
+        These can differ from the profile, e.g. an in-memory database always uses the "memory" journal.
+        """
+        report = {"profile": self.profile}
+        for pragma in PROFILES[self.profile]:
+            with self._timed(f"PRAGMA {pragma}") as event:
+                row = self.conn.execute(f"PRAGMA {pragma}").fetchone()
+                event["rows"] = 1 if row else 0
+            report[pragma] = row[0] if row else None  # e.g. mmap_size has no value in memory
+        return report
+
+    @contextmanager
+    @_uses_connection
+    def transaction(self):
+        """
+        Run several CRUD calls as one atomic unit with a single commit:
+
+            with db.transaction():
+                db.insert_record("student", {...})
+                db.insert_record("student_course", {...})
+
+        Inside the block the CRUD methods do not commit and re-raise errors, so any
+        failure rolls the whole block back. Nested blocks use savepoints, so an inner
+        block can fail and roll back without undoing the outer one.
+        Outside a block every CRUD call still commits on its own.
+        """
+        depth = self._transaction_depth
+        savepoint = f"sp_{depth}"
+        if depth == 0:
+            if self.conn.in_transaction:
+                # An implicit transaction left open by a raw conn.execute() write; BEGIN would fail
+                with self._timed("COMMIT"):
+                    self.conn.commit()
+            self._execute("BEGIN")
+        else:
+            self._execute(f"SAVEPOINT {savepoint}")
+        self._transaction_depth += 1
+
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if depth == 0:
+                self._rollback()
+                self._invalidate_written_tables()
+            else:
+                self._execute(f"ROLLBACK TO {savepoint}")
+                self._execute(f"RELEASE {savepoint}")
+            raise
+
+        self._transaction_depth -= 1
+        if depth == 0:
+            with self._timed("COMMIT"):
+                self.conn.commit()
+            self._invalidate_written_tables()
+        else:
+            self._execute(f"RELEASE {savepoint}")
+
+    def in_transaction(self) -> bool:
+        return self._transaction_depth > 0
+
+    def _execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        # conn.execute() for statements whose rows, if any, the caller does not count
+        with self._timed(sql):
+            return self.conn.execute(sql, params)
+
+    def _commit(self) -> None:
+        # Inside transaction() the block commits once at the end
+        if self._transaction_depth == 0:
+            with self._timed("COMMIT"):
+                self.conn.commit()
+
+    def _rollback(self) -> None:
+        with self._timed("ROLLBACK"):
+            self.conn.rollback()
+
+    def _written(self, table_name: str) -> None:
+        # Drop cached reads of the table once the write is committed and visible to every connection
+        if self.query_cache is None:
+            return
+        if self.in_transaction():
+            if getattr(self._local, "written_tables", None) is None:
+                self._local.written_tables = set()
+            self._local.written_tables.add(table_name)
+        else:
+            self.query_cache.invalidate(table_name)
+
+    def _invalidate_written_tables(self) -> None:
+        tables = getattr(self._local, "written_tables", None)
+        if tables:
+            self.query_cache.invalidate(*tables)
+        self._local.written_tables = None
+
+    def _cached_query(self, key: Tuple, tables: Tuple[str, ...], query, *args) -> Any:
+        # Reads inside a transaction may see its uncommitted writes, so they bypass the cache
+        if self.query_cache is None or self.in_transaction():
+            return query(*args)
+        hit, value = self.query_cache.get(key)
+        if hit:
+            return value
+        generation = self.query_cache.generation(tables)
+        value = query(*args)
+        self.query_cache.put(key, value, tables, generation)
+        return value
+
+    def query_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """QueryCache.stats() (hits, misses, hit_ratio, ...) when the query cache is on, otherwise None."""
+        return self.query_cache.stats() if self.query_cache is not None else None
+
+    @_uses_connection
+    def create_table(self, table_name, columns: dict,
+                     indexes: Optional[List[Union[str, Tuple[str, ...]]]] = None):
         """
         table_name: Name of the table
         columns example:
         {
             "id": "INTEGER",
             "name": "TEXT",
-            "age": "INTEGER"
+            "age": "INTEGER",
+            "FOREIGN KEY(course_id)": "REFERENCES course(id)"
         }
+        indexes: extra columns to index, e.g. ["last_name", ("last_name", "first_name")]
+        Every FOREIGN KEY column is indexed automatically, since joins look rows up by it.
         """
 
-        # Build SQL dynamically
-        column_defs = ", ".join([f"{col} {dtype}" for col, dtype in columns.items()])
+        try:
+            # Build SQL dynamically
+            column_defs = ", ".join([f"{col} {dtype}" for col, dtype in columns.items()])
+            sql = f"CREATE TABLE IF NOT EXISTS {quote_identifier(table_name)} ({column_defs})"
+
+            index_columns = []
+            for col in columns:
+                match = _FOREIGN_KEY.match(col.strip())
+                if match:
+                    index_columns.append(tuple(name.strip() for name in match.group(1).split(",")))
+            for index in indexes or []:
+                index_columns.append((index,) if isinstance(index, str) else tuple(index))
+
+            # Every index name and column is validated before anything runs, so a bad one creates nothing
+            index_sqls = []
+            for cols in dict.fromkeys(index_columns):  # drop duplicates, keep order
+                quoted_cols = ", ".join(quote_identifier(col) for col in cols)
+                index_name = quote_identifier(f"idx_{table_name}_{'_'.join(cols)}")
+                index_sqls.append(f"CREATE INDEX IF NOT EXISTS {index_name} "
+                                  f"ON {quote_identifier(table_name)} ({quoted_cols})")
 
-        sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({column_defs})"
+            with self._timed(sql):
+                self.cursor.execute(sql)
+            for index_sql in index_sqls:
+                with self._timed(index_sql):
+                    self.cursor.execute(index_sql)
 
-        self.cursor.execute(sql)
-        self.conn.commit()
-        print(f"Table '{table_name}' created successfully.")
+            self._commit()
+            print(f"Table '{table_name}' created successfully.")
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error creating table '{table_name}': {e}")
+            if self.in_transaction():
+                raise  # Let transaction() roll the whole block back
+            self._rollback()  # Close the implicit transaction the failed statement opened
 
+    @_uses_connection
+    def explain(self, sql: str, params: Tuple = (), large_table_rows: int = LARGE_TABLE_ROWS) -> List[str]:
+        """
+        Print and return the EXPLAIN QUERY PLAN steps of a query.
+        Prints a warning for every full table scan of a table with at least large_table_rows rows,
+        which usually means an index is missing.
+        """
+        try:
+            with self._timed(f"EXPLAIN QUERY PLAN {sql}") as event:
+                plan = [row[3] for row in self.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+                event["rows"] = len(plan)
+        except sqlite3.Error as e:
+            print(f"Error explaining query: {e}")
+            return []
+
+        # The plan names tables by their alias, so map aliases back to table names
+        aliases = {}
+        for table, alias in _TABLE_REFERENCE.findall(sql):
+            aliases[table] = table
+            if alias and alias.upper() not in _SQL_KEYWORDS:
+                aliases[alias] = table
+
+        for step in plan:
+            print(f"  {step}")
+            match = _FULL_SCAN.match(step)
+            if not match:
+                continue
+            table = aliases.get(match.group(1), match.group(1))
+            try:
+                with self._timed(f"SELECT COUNT(*) FROM {table}") as event:
+                    rows = self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    event["rows"] = 1
+            except sqlite3.Error:
+                continue
+            if rows >= large_table_rows:
+                print(f"Warning: full table scan of '{table}' ({rows} rows); consider an index")
+        return plan
+
+    @_uses_connection
     def insert_record(self, table_name: str, data: Dict[str, Any]) -> None:
         """
         Insert a record into the specified table.
         data: dict of column: value
         """
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        values = tuple(data.values())
-
-        sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
         try:
-            self.cursor.execute(sql, values)
-            self.conn.commit()
+            sql = self._build_sql("insert", table_name, tuple(data))
+            values = tuple(data.values())
+            with self._timed(sql) as event:
+                self.cursor.execute(sql, values)
+                event["rows"] = self.cursor.rowcount
+            self._commit()
+            self._written(table_name)
             print(f"Record inserted into '{table_name}'.")
-        except sqlite3.Error as e:
+        except (sqlite3.Error, ValueError) as e:
             print(f"Error inserting record into '{table_name}': {e}")
+            if self.in_transaction():
+                raise  # Let transaction() roll the whole block back
+            self._rollback()  # Close the implicit transaction the failed statement opened
 
+    @_uses_connection
+    def insert_many(self, table_name: str, rows: Union[Iterable[Dict[str, Any]], TextIO],
+                    batch_size: int = 1000) -> int:
+        """
+        Insert many records using executemany, committing once per batch.
+        rows: iterable of dicts (all with the same columns), or an open CSV file
+              whose header row names the columns
+        batch_size: rows per transaction; rows are read lazily, so only one batch
+                    is held in memory at a time
+        Returns the number of rows inserted. On error the failing batch is rolled back.
+        Inside transaction() batches are not committed separately and errors are re-raised.
+        """
+        if hasattr(rows, "read"):
+            rows = csv.DictReader(rows)
+        rows = iter(rows)
+
+        first_batch = list(islice(rows, batch_size))
+        if not first_batch:
+            return 0
+
+        columns = tuple(first_batch[0].keys())
+        try:
+            sql = self._build_sql("insert", table_name, columns)
+        except ValueError as e:
+            print(f"Error inserting batch into '{table_name}': {e}")
+            if self.in_transaction():
+                raise
+            return 0
+
+        inserted = 0
+        batch = first_batch
+        while batch:
+            try:
+                values = [tuple(row[col] for col in columns) for row in batch]
+                with self._timed(sql) as event:
+                    self.cursor.executemany(sql, values)
+                    event["rows"] = len(values)
+                self._commit()
+                inserted += len(batch)
+            except (sqlite3.Error, KeyError) as e:
+                print(f"Error inserting batch into '{table_name}' after {inserted} rows: {e}")
+                if self.in_transaction():
+                    raise
+                self._rollback()
+                break
+            batch = list(islice(rows, batch_size))
+        if inserted:
+            self._written(table_name)
+        return inserted
+
+    @_uses_connection
     def fetch_all(self, table_name: str) -> List[Tuple]:
         """
         Fetch all records from a table.
         Returns a list of tuples.
         """
-        sql = f"SELECT * FROM {table_name}"
         try:
-            self.cursor.execute(sql)
-            rows = self.cursor.fetchall()
+            sql = self._build_sql("select", table_name)
+            with self._timed(sql) as event:
+                self.cursor.execute(sql)
+                rows = self.cursor.fetchall()
+                event["rows"] = len(rows)
             return rows
-        except sqlite3.Error as e:
+        except (sqlite3.Error, ValueError) as e:
             print(f"Error fetching data from '{table_name}': {e}")
             return []
 
+    @_uses_connection
     def fetch_by_condition(self, table_name: str, condition: str, params: Tuple = ()) -> List[Tuple]:
         """
         Fetch records matching the condition.
         condition: SQL condition string e.g. "id = ?"
         params: tuple of values for placeholders
         """
-        sql = f"SELECT * FROM {table_name} WHERE {condition}"
         try:
-            self.cursor.execute(sql, params)
-            rows = self.cursor.fetchall()
+            sql = self._build_sql("select", table_name, (), condition)
+            with self._timed(sql) as event:
+                self.cursor.execute(sql, params)
+                rows = self.cursor.fetchall()
+                event["rows"] = len(rows)
             return rows
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error fetching data with condition from '{table_name}': {e}")
+            return []
+
+    def _row_type(self, description) -> type:
+        # One namedtuple class per column layout; rename=True copes with names like "COUNT(*)"
+        columns = tuple(column[0] for column in description)
+        if columns not in self._row_types:
+            self._row_types[columns] = namedtuple("Row", columns, rename=True)
+        return self._row_types[columns]
+
+    def _iter_batches(self, sql: str, params: Tuple, batch_size: int) -> Iterator[Tuple[Tuple, List[Tuple]]]:
+        # (cursor.description, rows) for every fetchmany batch, and at least once, so an empty result
+        # still has its columns. A cursor of its own, so other calls on this object can run while the
+        # caller iterates. Only time spent in SQLite is timed, not the time the caller spends between batches.
+        seconds = 0.0
+        event = {"rows": 0}
+        cursor = self.conn.cursor()
+        try:
+            start = time.perf_counter()
+            cursor.execute(sql, params)
+            seconds += time.perf_counter() - start
+            first = True
+            while True:
+                start = time.perf_counter()
+                rows = cursor.fetchmany(batch_size)
+                seconds += time.perf_counter() - start
+                if not rows and not first:
+                    return
+                first = False
+                event["rows"] += len(rows)
+                yield cursor.description, rows
+                if not rows:
+                    return
         except sqlite3.Error as e:
+            event["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            cursor.close()
+            if self._timing():
+                event["sql"] = _sql_template(sql)
+                event["seconds"] = seconds
+                self._record(event)
+
+    def _iter_query(self, sql: str, params: Tuple, batch_size: int, as_rows: bool) -> Iterator[Tuple]:
+        row_type = None
+        with closing(self._iter_batches(sql, params, batch_size)) as batches:
+            for description, rows in batches:
+                if as_rows:
+                    row_type = row_type or self._row_type(description)._make
+                    rows = map(row_type, rows)
+                yield from rows
+
+    @_uses_connection
+    def iter_all(self, table_name: str, batch_size: int = FETCH_BATCH_SIZE, as_rows: bool = False) -> Iterator[Tuple]:
+        """
+        Yield every record of a table without loading the whole table into memory.
+        Rows are fetched batch_size at a time. With as_rows=True each row is a namedtuple,
+        so columns can be read as row.first_name as well as row[1].
+        """
+        try:
+            sql = self._build_sql("select", table_name)
+            yield from self._iter_query(sql, (), batch_size, as_rows)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error fetching data from '{table_name}': {e}")
+
+    @_uses_connection
+    def iter_where(self, table_name: str, condition: str, params: Tuple = (),
+                   batch_size: int = FETCH_BATCH_SIZE, as_rows: bool = False) -> Iterator[Tuple]:
+        """
+        Streaming version of fetch_by_condition.
+        condition: SQL condition string e.g. "course_id = ?"
+        params: tuple of values for placeholders
+        """
+        try:
+            sql = self._build_sql("select", table_name, (), condition)
+            yield from self._iter_query(sql, params, batch_size, as_rows)
+        except (sqlite3.Error, ValueError) as e:
             print(f"Error fetching data with condition from '{table_name}': {e}")
+
+    @_uses_connection
+    def page_after(self, table_name: str, last_id: Optional[Any] = None, limit: int = 100,
+                   key: str = "id", as_rows: bool = False) -> List[Tuple]:
+        """
+        Keyset pagination: return up to `limit` records whose key is greater than last_id,
+        ordered by key. Pass None for the first page, then the key of the last row returned.
+        Unlike LIMIT/OFFSET, every page is an index lookup, however deep it is.
+        """
+        try:
+            key = quote_identifier(key)
+            sql = self._build_sql("select", table_name, (), None if last_id is None else f"{key} > ?")
+            params = (limit,) if last_id is None else (last_id, limit)
+            sql += f" ORDER BY {key} LIMIT ?"
+            return list(self._iter_query(sql, params, limit, as_rows))
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error fetching page from '{table_name}': {e}")
             return []
 
+    @_uses_connection
     def update_record(self, table_name: str, update_data: Dict[str, Any], condition: str, params: Tuple) -> None:
         """
         Update records in a table matching the condition.
@@ -85,47 +996,175 @@ class CollegeDatabase:
         condition: SQL condition string e.g. "id = ?"
         params: tuple of values for condition placeholders
         """
-        set_clause = ", ".join([f"{col} = ?" for col in update_data.keys()])
-        values = tuple(update_data.values()) + params
-
-        sql = f"UPDATE {table_name} SET {set_clause} WHERE {condition}"
         try:
-            self.cursor.execute(sql, values)
-            self.conn.commit()
+            sql = self._build_sql("update", table_name, tuple(update_data), condition)
+            values = tuple(update_data.values()) + params
+            with self._timed(sql) as event:
+                self.cursor.execute(sql, values)
+                event["rows"] = self.cursor.rowcount
+            self._commit()
+            self._written(table_name)
             print(f"Record(s) updated in '{table_name}'.")
-        except sqlite3.Error as e:
+        except (sqlite3.Error, ValueError) as e:
             print(f"Error updating records in '{table_name}': {e}")
+            if self.in_transaction():
+                raise
+            self._rollback()  # Close the implicit transaction the failed statement opened
 
+    @_uses_connection
     def delete_record_by_condition(self, table_name: str, condition: str, params: Tuple) -> None:
         """
         Delete records from a table matching the condition.
         condition: SQL condition string e.g. "id = ?"
         params: tuple of values for placeholders
         """
-        sql = f"DELETE FROM {table_name} WHERE {condition}"
         try:
-            self.cursor.execute(sql, params)
-            self.conn.commit()
+            sql = self._build_sql("delete", table_name, (), condition)
+            with self._timed(sql) as event:
+                self.cursor.execute(sql, params)
+                event["rows"] = self.cursor.rowcount
+            self._commit()
+            self._written(table_name)
             print(f"Record(s) deleted from '{table_name}'.")
-        except sqlite3.Error as e:
+        except (sqlite3.Error, ValueError) as e:
             print(f"Error deleting records from '{table_name}': {e}")
+            if self.in_transaction():
+                raise
+            self._rollback()  # Close the implicit transaction the failed statement opened
 
+    @_records_call
     def count_students_in_course(self, course_code: str) -> int:
-        sql = """
-        SELECT COUNT(DISTINCT sc.student_id) 
-        FROM student_course sc
-        JOIN course c ON sc.course_id = c.id
-        WHERE c.course_code = ?
-        """
         try:
-            self.cursor.execute(sql, (course_code,))
-            count = self.cursor.fetchone()[0]
-            return count
+            return self._cached_query(("count_students_in_course", course_code),
+                                      ("student_course", "course", "course_stats"),
+                                      self._count_students_in_course, course_code)
         except sqlite3.Error as e:
             print(f"Error counting students for course {course_code}: {e}")
             return 0
 
+    @_uses_connection
+    def _count_students_in_course(self, course_code: str) -> int:
+        if self._has_course_stats():
+            # One primary key lookup per table, whatever the number of enrolments
+            sql = """
+            SELECT COALESCE(MAX(cs.student_count), 0)
+            FROM course c
+            LEFT JOIN course_stats cs ON cs.course_id = c.id
+            WHERE c.course_code = ?
+            """
+        else:
+            sql = """
+            SELECT COUNT(DISTINCT sc.student_id) 
+            FROM student_course sc
+            JOIN course c ON sc.course_id = c.id
+            WHERE c.course_code = ?
+            """
+        with self._timed(sql) as event:
+            self.cursor.execute(sql, (course_code,))
+            count = self.cursor.fetchone()[0]
+            event["rows"] = 1
+        return count
+
+    def _has_course_stats(self) -> bool:
+        if self._course_stats_enabled is None:
+            sql = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'student_course_stats_insert'"
+            with self._timed(sql) as event:
+                self.cursor.execute(sql)
+                self._course_stats_enabled = self.cursor.fetchone() is not None
+                event["rows"] = int(self._course_stats_enabled)
+        return self._course_stats_enabled
+
+    @_uses_connection
+    def enable_course_stats(self) -> None:
+        """
+        Opt in to the course_stats table: per-course student and teacher counts kept exact
+        by triggers on student_course and teacher_course, so count_students_in_course
+        no longer scans enrolments. The student_course and teacher_course tables must exist.
+        The setting is stored in the database file and safe to call again.
+        """
+        with self.transaction():
+            self._execute("""
+                CREATE TABLE IF NOT EXISTS course_stats (
+                    course_id INTEGER PRIMARY KEY,
+                    student_count INTEGER NOT NULL DEFAULT 0,
+                    teacher_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            for table, member, counter in COURSE_STATS_COUNTERS:
+                # The triggers look up (course_id, member) pairs on every write
+                self._execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_course_id_{member} "
+                              f"ON {table} (course_id, {member})")
+                for trigger in _COURSE_STATS_TRIGGERS.format(table=table, member=member, counter=counter).split(";\n\n"):
+                    self._execute(trigger)
+            self._rebuild_course_stats()
+        self._course_stats_enabled = True
+        self._written("course_stats")
+        print("Course stats enabled.")
+
+    def _actual_course_stats(self) -> Dict[int, Tuple[int, int]]:
+        counts = {}
+        for position, (table, member, _) in enumerate(COURSE_STATS_COUNTERS):
+            sql = (f"SELECT course_id, COUNT(DISTINCT {member}) FROM {table} "
+                   f"WHERE course_id IS NOT NULL GROUP BY course_id")
+            with self._timed(sql) as event:
+                rows = self.conn.execute(sql).fetchall()
+                event["rows"] = len(rows)
+            for course_id, count in rows:
+                row = counts.setdefault(course_id, [0, 0])
+                row[position] = count
+        return {course_id: tuple(row) for course_id, row in counts.items()}
+
+    def _rebuild_course_stats(self) -> None:
+        with self._timed("DELETE FROM course_stats") as event:
+            event["rows"] = self.conn.execute("DELETE FROM course_stats").rowcount
+        values = [(course_id, students, teachers)
+                  for course_id, (students, teachers) in self._actual_course_stats().items()]
+        sql = "INSERT INTO course_stats (course_id, student_count, teacher_count) VALUES (?, ?, ?)"
+        with self._timed(sql) as event:
+            self.conn.executemany(sql, values)
+            event["rows"] = len(values)
+
+    @_uses_connection
+    def check_course_stats(self) -> List[Tuple[int, Tuple[int, int], Tuple[int, int]]]:
+        """
+        Compare course_stats with counts recomputed from the join tables.
+        Returns (course_id, (stored students, stored teachers), (actual students, actual teachers))
+        for every course that differs; an empty list means the counters are exact.
+        """
+        sql = "SELECT course_id, student_count, teacher_count FROM course_stats"
+        with self._timed(sql) as event:
+            stored = {course_id: (students, teachers) for course_id, students, teachers in self.conn.execute(sql)}
+            event["rows"] = len(stored)
+        actual = self._actual_course_stats()
+        mismatches = []
+        for course_id in sorted(stored.keys() | actual.keys()):
+            stored_counts = stored.get(course_id, (0, 0))
+            actual_counts = actual.get(course_id, (0, 0))
+            if stored_counts != actual_counts:
+                mismatches.append((course_id, stored_counts, actual_counts))
+        return mismatches
+
+    @_uses_connection
+    def rebuild_course_stats(self) -> None:
+        """Recompute course_stats from the join tables, e.g. after rows were changed with triggers off."""
+        with self.transaction():
+            self._rebuild_course_stats()
+        self._written("course_stats")
+        print("Course stats rebuilt.")
+
+    @_records_call
     def list_teachers_for_course(self, course_code: str) -> list:
+        try:
+            # Cached as a tuple and copied, so callers cannot change the cached rows
+            return list(self._cached_query(("list_teachers_for_course", course_code),
+                                           ("teacher_course", "teacher", "course"),
+                                           self._list_teachers_for_course, course_code))
+        except sqlite3.Error as e:
+            print(f"Error fetching teachers for course {course_code}: {e}")
+            return []
+
+    @_uses_connection
+    def _list_teachers_for_course(self, course_code: str) -> tuple:
         sql = """
         SELECT t.first_name, t.last_name 
         FROM teacher_course tc
@@ -133,15 +1172,17 @@ class CollegeDatabase:
         JOIN course c ON tc.course_id = c.id
         WHERE c.course_code = ?
         """
-        try:
+        with self._timed(sql) as event:
             self.cursor.execute(sql, (course_code,))
-            return self.cursor.fetchall()  # List of (first_name, last_name)
-        except sqlite3.Error as e:
-            print(f"Error fetching teachers for course {course_code}: {e}")
-            return []
+            rows = tuple(self.cursor.fetchall())  # (first_name, last_name) rows
+            event["rows"] = len(rows)
+        return rows
 
     def close(self) -> None:
-        self.conn.close()
+        if self._pool is not None:
+            self._pool.close()
+        else:
+            self.conn.close()
 
 
 if __name__ == "__main__":
@@ -302,13 +1343,15 @@ if __name__ == "__main__":
         "phone": "555-5678"
     })
 
-    # Enroll students in courses
-    database.insert_record("student_course", {"student_id": 1, "course_id": 1})  # Student 1 in MSE800
-    database.insert_record("student_course", {"student_id": 2, "course_id": 1})  # Student 2 in MSE800
+    # Enroll students and assign teachers as one transaction (a single commit)
+    with database.transaction():
+        # Enroll students in courses
+        database.insert_record("student_course", {"student_id": 1, "course_id": 1})  # Student 1 in MSE800
+        database.insert_record("student_course", {"student_id": 2, "course_id": 1})  # Student 2 in MSE800
 
-    # Assign teachers to courses
-    database.insert_record("teacher_course", {"teacher_id": 1, "course_id": 2})  # Teacher 1 teaches MSE801
-    database.insert_record("teacher_course", {"teacher_id": 2, "course_id": 2})  # Teacher 2 teaches MSE801
+        # Assign teachers to courses
+        database.insert_record("teacher_course", {"teacher_id": 1, "course_id": 2})  # Teacher 1 teaches MSE801
+        database.insert_record("teacher_course", {"teacher_id": 2, "course_id": 2})  # Teacher 2 teaches MSE801
 
     student_count = database.count_students_in_course("MSE800")
     print(f"Number of students enrolled in MSE800: {student_count}")
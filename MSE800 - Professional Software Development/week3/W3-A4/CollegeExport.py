@@ -0,0 +1,227 @@
+# Author: Oshan Mendis
+# Date: 2026-10-16
+# Description: Columnar export of CollegeDatabase tables and queries to NumPy, Arrow, Parquet and CSV
+
+import argparse
+import csv
+import re
+from contextlib import closing
+from typing import Any, Iterator, List, Optional, Tuple
+
+from CollegeDatabase import CollegeDatabase, quote_identifier
+
+# Rows per chunk: one chunk of Python tuples is alive at a time, then it is turned into columns
+EXPORT_CHUNK_SIZE = 65_536
+
+_PLAIN_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _column_kind(declared_type: str) -> Optional[str]:
+    """
+    Kind matching the SQLite type affinity of a declared column type: int, text, float for REAL and
+    NUMERIC affinity (e.g. DECIMAL, NUMERIC, DOUBLE), or None for BLOB affinity / no declared type.
+    Only used for columns that hold no values to look at.
+    """
+    declared_type = declared_type.upper()
+    if "INT" in declared_type:
+        return "int"
+    if any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+        return "text"
+    if not declared_type or "BLOB" in declared_type:
+        return None
+    return "float"
+
+
+# Bits of the storage classes found in a column, see _scan_storage()
+_INTEGER, _REAL, _TEXT, _BLOB = 1, 2, 4, 8
+
+
+def _scan_storage(database: CollegeDatabase, sql: str, params: Tuple, width: int) -> List[int]:
+    """
+    For each column of the result, the storage classes (_INTEGER | _REAL | ...) of its values, from one
+    aggregate pass inside SQLite. The CTE renames the columns by position, so duplicate names are fine.
+    SUM(DISTINCT ...) of distinct one-bit flags is their bitwise OR.
+    """
+    names = [f"c{i}" for i in range(width)]
+    flags = ", ".join(f"COALESCE(SUM(DISTINCT CASE typeof({name}) WHEN 'integer' THEN {_INTEGER} "
+                      f"WHEN 'real' THEN {_REAL} WHEN 'text' THEN {_TEXT} WHEN 'blob' THEN {_BLOB} END), 0)"
+                      for name in names)
+    row = database._execute(f"WITH q({', '.join(names)}) AS ({sql}) SELECT {flags} FROM q", params).fetchone()
+    return [int(value) for value in row]
+
+
+def _storage_kind(name: str, storage: int, declared_kind: Optional[str]) -> Tuple[str, bool]:
+    """
+    (kind, convert to str) for a column, from the storage classes its values actually have, so every value
+    fits the exported type: integers and reals become float, and numbers mixed with text become strings.
+    """
+    if storage & _BLOB:
+        if storage != _BLOB:
+            raise ValueError(f"Column '{name}' mixes blobs with other values and cannot be exported as one type")
+        return "blob", False
+    if storage & _TEXT:
+        return "text", storage != _TEXT
+    if storage & _REAL:
+        return "float", False
+    if storage & _INTEGER:
+        return "int", False
+    return declared_kind or "text", False  # NULL throughout, or no rows
+
+
+class _Columns:
+    """Names, kinds and nullability of the exported columns, fixed before the first chunk."""
+
+    def __init__(self, names: List[str], kinds: List[str], nullable: List[bool], to_text: List[int]):
+        self.names = names
+        self.kinds = kinds
+        self.nullable = nullable
+        self.to_text = to_text  # positions of text columns that also hold numbers
+
+    def normalise(self, rows: List[Tuple]) -> List[Tuple]:
+        if not self.to_text:
+            return rows
+        positions = set(self.to_text)
+        return [tuple(str(value) if position in positions and value is not None else value
+                      for position, value in enumerate(row)) for row in rows]
+
+    def numpy_dtype(self):
+        import numpy as np
+
+        fields = []
+        for name, kind, nullable in zip(self.names, self.kinds, self.nullable):
+            if kind == "int":
+                fields.append((name, "f8" if nullable else "i8"))  # NULL needs NaN, so nullable ints become floats
+            elif kind == "float":
+                fields.append((name, "f8"))
+            else:
+                fields.append((name, "O"))
+        return np.dtype(fields)
+
+    def arrow_schema(self):
+        import pyarrow as pa
+
+        types = {"int": pa.int64(), "float": pa.float64(), "text": pa.string(), "blob": pa.binary()}
+        return pa.schema([pa.field(name, types[kind], nullable=nullable)
+                          for name, kind, nullable in zip(self.names, self.kinds, self.nullable)])
+
+
+def _source_sql(source: str) -> Tuple[str, Optional[str]]:
+    """A plain name is a table to export whole; anything else is a SELECT query."""
+    if _PLAIN_NAME.match(source):
+        return f"SELECT * FROM {quote_identifier(source)}", source
+    return source, None
+
+
+def _iter_chunks(database: CollegeDatabase, source: str, params: Tuple,
+                 chunk_size: int) -> Iterator[Tuple[_Columns, List[Tuple]]]:
+    # Statements go through the database, so instrument() sees the export like any other query
+    sql, table = _source_sql(source)
+    with database.connection():
+        declared = {}
+        if table is not None:
+            for _, name, declared_type, notnull, _, pk in database._execute(
+                    f"PRAGMA table_info({quote_identifier(table)})").fetchall():
+                integer_key = pk and _column_kind(declared_type) == "int"
+                declared[name] = (_column_kind(declared_type), not (notnull or integer_key))
+
+        columns = None
+        with closing(database._iter_batches(sql, params, chunk_size)) as batches:
+            for description, rows in batches:
+                if columns is None:
+                    names = [column[0] for column in description]
+                    storage = _scan_storage(database, sql, params, len(names))
+                    kinds, nullable, to_text = [], [], []
+                    for position, name in enumerate(names):
+                        declared_kind, can_be_null = declared.get(name, (None, True))
+                        kind, convert = _storage_kind(name, storage[position], declared_kind)
+                        kinds.append(kind)
+                        nullable.append(can_be_null)
+                        if convert:
+                            to_text.append(position)
+                    columns = _Columns(names, kinds, nullable, to_text)
+                yield columns, columns.normalise(rows)
+
+
+def iter_numpy_chunks(database: CollegeDatabase, source: str, params: Tuple = (),
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield a table (by name) or SELECT query result as NumPy structured arrays of up to chunk_size rows.
+    Integer columns that allow NULL become float64 with NaN; text and blobs are object fields.
+    """
+    import numpy as np
+
+    dtype = None
+    for columns, rows in _iter_chunks(database, source, params, chunk_size):
+        dtype = dtype or columns.numpy_dtype()
+        yield np.array(rows, dtype=dtype)
+
+
+def iter_record_batches(database: CollegeDatabase, source: str, params: Tuple = (),
+                        chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield a table (by name) or SELECT query result as pyarrow RecordBatches of up to chunk_size rows.
+    Column types come from the values the result actually holds; see _storage_kind().
+    """
+    import pyarrow as pa
+
+    schema = None
+    for columns, rows in _iter_chunks(database, source, params, chunk_size):
+        schema = schema or columns.arrow_schema()
+        arrays = []
+        for values, field in zip(zip(*rows) if rows else [[]] * len(schema), schema):  # [] keeps an empty result's schema
+            try:
+                # safe=True: a value that does not fit (e.g. 5.5 in int64) raises instead of being truncated
+                arrays.append(pa.array(values, type=field.type, safe=True))
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise ValueError(f"Column '{field.name}' does not fit its exported type {field.type}: {e}") from e
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def export_parquet(database: CollegeDatabase, source: str, path: str, params: Tuple = (),
+                   chunk_size: int = EXPORT_CHUNK_SIZE, compression: str = "zstd") -> int:
+    """Write a table or query result to a Parquet file, one row group per chunk. Returns the row count."""
+    import pyarrow.parquet as pq
+
+    written = 0
+    writer = None
+    try:
+        for batch in iter_record_batches(database, source, params, chunk_size):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+            if batch.num_rows:
+                writer.write_batch(batch)
+                written += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def export_csv(database: CollegeDatabase, source: str, path: str, params: Tuple = (),
+               chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """Write a table or query result to a CSV file with a header row. Needs no extra packages."""
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        header = None
+        for columns, rows in _iter_chunks(database, source, params, chunk_size):
+            if header is None:
+                header = columns.names
+                writer.writerow(header)
+            writer.writerows(rows)
+            written += len(rows)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a college database table or query.")
+    parser.add_argument("source", help="table name, or a SELECT query in quotes")
+    parser.add_argument("output", help="output file, .parquet or .csv")
+    parser.add_argument("--db", default="yoobee_college.db", help="college database file")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    college = CollegeDatabase(args.db)
+    export = export_parquet if args.output.endswith(".parquet") else export_csv
+    print(f"Exported {export(college, args.source, args.output, chunk_size=args.chunk_size)} rows to {args.output}")
+    college.close()
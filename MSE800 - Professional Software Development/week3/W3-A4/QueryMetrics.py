@@ -0,0 +1,132 @@
+# Author: Oshan Mendis
+# Date: 2026-10-16
+# Description: Sinks for CollegeDatabase.instrument() - a per-query latency histogram and a JSON lines log
+
+import argparse
+import json
+import threading
+from typing import Any, Dict, List, Optional
+
+# Bucket i holds durations below 2**i microseconds; the last bucket (> 8.6 s) holds everything slower
+HISTOGRAM_BUCKETS = 24
+
+
+def _bucket(seconds: float) -> int:
+    return min(int(seconds * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)
+
+
+class _QueryStats:
+    __slots__ = ("count", "errors", "rows", "total_seconds", "max_seconds", "buckets", "callers")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+        self.callers = {}
+
+    def percentile(self, fraction: float) -> float:
+        """Upper edge of the bucket holding the given fraction of calls, capped at the slowest call seen."""
+        wanted = self.count * fraction
+        seen = 0
+        for i, calls in enumerate(self.buckets):
+            seen += calls
+            if calls and seen >= wanted:
+                return min((1 << i) / 1e6, self.max_seconds)
+        return self.max_seconds
+
+
+class HistogramSink:
+    """
+    Aggregates events in memory per SQL template: calls, rows, errors, total and max time,
+    and a log2 histogram of durations for the percentiles. Safe to share between threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _QueryStats] = {}
+
+    def record(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            stats = self._stats.get(event["sql"])
+            if stats is None:
+                stats = self._stats[event["sql"]] = _QueryStats()
+            seconds = event["seconds"]
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.buckets[_bucket(seconds)] += 1
+            stats.rows += event.get("rows") or 0
+            if "error" in event:
+                stats.errors += 1
+            caller = event.get("method")
+            stats.callers[caller] = stats.callers.get(caller, 0) + 1
+
+    def report(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """One dict per SQL template, ordered by total time spent in it."""
+        with self._lock:
+            rows = [{
+                "sql": sql,
+                "count": stats.count,
+                "errors": stats.errors,
+                "rows": stats.rows,
+                "total_ms": stats.total_seconds * 1000,
+                "mean_ms": stats.total_seconds / stats.count * 1000,
+                "p50_ms": stats.percentile(0.50) * 1000,
+                "p95_ms": stats.percentile(0.95) * 1000,
+                "p99_ms": stats.percentile(0.99) * 1000,
+                "max_ms": stats.max_seconds * 1000,
+                "methods": dict(stats.callers),
+            } for sql, stats in self._stats.items()]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:top] if top else rows
+
+    def print_report(self, top: Optional[int] = 10) -> None:
+        print(f"{'calls':>8} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9} {'rows':>9}  sql")
+        for row in self.report(top):
+            print(f"{row['count']:>8,} {row['total_ms']:>10,.1f} {row['mean_ms']:>9.3f} {row['p95_ms']:>9.3f} "
+                  f"{row['max_ms']:>9.3f} {row['rows']:>9,}  {row['sql'][:100]}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class JsonLinesSink:
+    """Appends each event to a file as one JSON object per line, e.g. as the slow query log."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def record(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def summarise(path: str) -> HistogramSink:
+    """Load a JSON lines log back into a histogram."""
+    histogram = HistogramSink()
+    with open(path, encoding="utf-8") as log_file:
+        for line in log_file:
+            if line.strip():
+                histogram.record(json.loads(line))
+    return histogram
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise a CollegeDatabase JSON lines query log.")
+    parser.add_argument("log", help="file written by JsonLinesSink")
+    parser.add_argument("--top", type=int, default=10, help="queries to show, by total time")
+    args = parser.parse_args()
+
+    summarise(args.log).print_report(args.top)
@@ -0,0 +1,90 @@
+# Author: Oshan Mendis
+# Description: Event-loop responsiveness under concurrent database load -
+#              blocking CollegeDatabase calls vs AsyncCollegeDatabase
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from AsyncCollegeDatabase import AsyncCollegeDatabase
+from CollegeDatabase import CollegeDatabase
+from bench_profiles import COURSES, build, quiet
+
+TICK = 0.001  # the heartbeat expects to wake up every millisecond
+
+
+async def heartbeat(stop, lags):
+    """Records how late the event loop wakes a 1 ms sleep - the delay every other request would see."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        lags.append(loop.time() - start - TICK)
+
+
+async def blocking_client(database, requests, i):
+    # What the API layer does today: sync calls straight from a coroutine
+    for n in range(requests):
+        database.count_students_in_course(f"MSE{800 + (i + n) % COURSES}")
+        database.insert_record("student_course", {"student_id": i, "course_id": 1 + n % COURSES})
+        await asyncio.sleep(0)
+
+
+async def async_client(database, requests, i):
+    for n in range(requests):
+        await database.count_students_in_course(f"MSE{800 + (i + n) % COURSES}")
+        await database.insert_record("student_course", {"student_id": i, "course_id": 1 + n % COURSES})
+
+
+async def run(database, client, clients, requests):
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(heartbeat(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(client(database, requests, i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+    lags.sort()
+    return {
+        "ops/s": clients * requests * 2 / elapsed,
+        "lag p50 ms": statistics.median(lags) * 1000 if lags else 0.0,
+        "lag p99 ms": lags[int(len(lags) * 0.99)] * 1000 if lags else 0.0,
+        "lag max ms": lags[-1] * 1000 if lags else 0.0,
+        "ticks": len(lags),
+    }
+
+
+async def main(path, clients, requests):
+    columns = ["ops/s", "lag p50 ms", "lag p99 ms", "lag max ms", "ticks"]
+    print(f"{clients} clients x {requests} (count + insert) requests")
+    print(f"{'':<22}" + "".join(f"{column:>12}" for column in columns))
+
+    database = CollegeDatabase(path, "balanced")
+    with quiet():
+        results = await run(database, blocking_client, clients, requests)
+    database.close()
+    print(f"{'CollegeDatabase':<22}" + "".join(f"{results[column]:>12,.2f}" for column in columns))
+
+    async with AsyncCollegeDatabase(path, "balanced") as database:
+        with quiet():
+            results = await run(database, async_client, clients, requests)
+    print(f"{'AsyncCollegeDatabase':<22}" + "".join(f"{results[column]:>12,.2f}" for column in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure event-loop lag under database load.")
+    parser.add_argument("--students", type=int, default=50_000, help="students and enrolments loaded first")
+    parser.add_argument("--clients", type=int, default=20, help="concurrent client coroutines")
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "async.db")
+        setup = CollegeDatabase(db_path, "bulk-load")
+        build(setup, args.students)
+        setup.close()
+        asyncio.run(main(db_path, args.clients, args.requests))
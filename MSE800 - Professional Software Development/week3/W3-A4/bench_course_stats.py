@@ -0,0 +1,47 @@
+# Author: Oshan Mendis
+# Description: count_students_in_course latency by enrolment volume, COUNT(DISTINCT) join vs course_stats
+
+import argparse
+import os
+import tempfile
+import time
+
+from CollegeDatabase import CollegeDatabase
+from bench_profiles import COURSES, build, quiet
+
+
+def time_counts(database, queries):
+    start = time.perf_counter()
+    for i in range(queries):
+        database.count_students_in_course(f"MSE{800 + i % COURSES}")
+    return (time.perf_counter() - start) / queries * 1_000_000
+
+
+def time_enrolments(database, rows):
+    start = time.perf_counter()
+    database.insert_many("student_course", (
+        {"student_id": n, "course_id": 1 + n % COURSES} for n in range(rows)), 10_000)
+    return rows / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark trigger-maintained course counters.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="students (one enrolment each) per run")
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'enrolments':>10} {'join us/query':>14} {'stats us/query':>15} "
+          f"{'insert rows/s':>14} {'with triggers':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            database = CollegeDatabase(os.path.join(tmp, f"stats_{size}.db"), "balanced")
+            build(database, size)
+            join = time_counts(database, args.queries)
+            plain_inserts = time_enrolments(database, 20_000)
+            with quiet():
+                database.enable_course_stats()
+            stats = time_counts(database, args.queries)
+            trigger_inserts = time_enrolments(database, 20_000)
+            database.close()
+            print(f"{size:>10,} {join:>14,.1f} {stats:>15,.1f} {plain_inserts:>14,.0f} {trigger_inserts:>14,.0f}")
@@ -0,0 +1,98 @@
+# Author: Oshan Mendis
+# Description: Benchmark of bulk student inserts - insert_many vs one insert_record call per row
+
+import argparse
+import contextlib
+import csv
+import os
+import tempfile
+import time
+
+from CollegeDatabase import CollegeDatabase
+
+STUDENT_COLUMNS = {
+    "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+    "first_name": "TEXT",
+    "last_name": "TEXT",
+    "dob": "TEXT",
+    "email": "TEXT UNIQUE"
+}
+
+
+def synthetic_students(count, start=0):
+    """Yields student rows one at a time, so millions never sit in memory."""
+    for i in range(start, start + count):
+        yield {
+            "first_name": f"First{i}",
+            "last_name": f"Last{i % 5000}",
+            "dob": f"{1980 + i % 25}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "email": f"student{i}@yoobee.com"
+        }
+
+
+def fresh_database(directory, name):
+    path = os.path.join(directory, name)
+    with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+        database = CollegeDatabase(path)
+        database.create_table("student", STUDENT_COLUMNS)
+    return database
+
+
+def bench_single_rows(directory, rows):
+    database = fresh_database(directory, "single.db")
+    start = time.perf_counter()
+    # insert_record prints once per row; keep that out of the timing noise
+    with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+        for row in synthetic_students(rows):
+            database.insert_record("student", row)
+    elapsed = time.perf_counter() - start
+    database.close()
+    return elapsed
+
+
+def bench_insert_many(directory, rows, batch_size):
+    database = fresh_database(directory, "bulk.db")
+    start = time.perf_counter()
+    inserted = database.insert_many("student", synthetic_students(rows), batch_size)
+    elapsed = time.perf_counter() - start
+    database.close()
+    return elapsed, inserted
+
+
+def bench_csv(directory, rows, batch_size):
+    csv_path = os.path.join(directory, "students.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=["first_name", "last_name", "dob", "email"])
+        writer.writeheader()
+        writer.writerows(synthetic_students(rows))
+
+    database = fresh_database(directory, "csv.db")
+    start = time.perf_counter()
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        inserted = database.insert_many("student", csv_file, batch_size)
+    elapsed = time.perf_counter() - start
+    database.close()
+    return elapsed, inserted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bulk student inserts.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="students loaded by insert_many")
+    parser.add_argument("--single-rows", type=int, default=2_000,
+                        help="students loaded one by one (extrapolated to --rows, one fsync each)")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = bench_single_rows(tmp, args.single_rows)
+        single_rate = args.single_rows / single
+        print(f"insert_record  : {args.single_rows:>9,} rows in {single:7.2f}s -> {single_rate:>10,.0f} rows/s "
+              f"(~{args.rows / single_rate / 60:,.1f} min for {args.rows:,})")
+
+        bulk, inserted = bench_insert_many(tmp, args.rows, args.batch_size)
+        print(f"insert_many    : {inserted:>9,} rows in {bulk:7.2f}s -> {inserted / bulk:>10,.0f} rows/s")
+
+        from_csv, inserted = bench_csv(tmp, args.rows, args.batch_size)
+        print(f"insert_many CSV: {inserted:>9,} rows in {from_csv:7.2f}s -> {inserted / from_csv:>10,.0f} rows/s")
+
+        print(f"Speed-up of insert_many: {(inserted / bulk) / single_rate:,.0f}x")
@@ -0,0 +1,49 @@
+# Author: Oshan Mendis
+# Description: Cost of CollegeDatabase.instrument() on small, frequent calls - off, histogram, and JSON lines log
+
+import argparse
+import os
+import tempfile
+import time
+
+from CollegeDatabase import CollegeDatabase
+from QueryMetrics import HistogramSink, JsonLinesSink
+from bench_insert_many import STUDENT_COLUMNS
+from bench_profiles import quiet
+
+ROW = {"first_name": "Oshan", "last_name": "Mendis", "dob": "1995-10-23", "email": None}
+
+
+def run(calls, sink):
+    """insert_record + fetch_by_condition pairs on an in-memory table inside one transaction."""
+    database = CollegeDatabase(":memory:")
+    with quiet():
+        database.create_table("student", STUDENT_COLUMNS)
+        database.instrument(sink)
+        start = time.perf_counter()
+        with database.transaction():
+            for i in range(calls):
+                database.insert_record("student", ROW)
+                database.fetch_by_condition("student", "id = ?", (i + 1,))
+        elapsed = time.perf_counter() - start
+    database.close()
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CollegeDatabase query instrumentation overhead.")
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = JsonLinesSink(os.path.join(tmp, "queries.jsonl"))
+        histogram = HistogramSink()
+        baseline = None
+        for label, sink in [("not instrumented", None), ("HistogramSink", histogram), ("JsonLinesSink", log)]:
+            elapsed = run(args.calls, sink)
+            baseline = baseline or elapsed
+            print(f"{label:<18} {args.calls * 2 / elapsed:>10,.0f} calls/s  "
+                  f"(+{(elapsed / baseline - 1) * 100:.0f}% time)")
+        log.close()
+    print()
+    histogram.print_report()
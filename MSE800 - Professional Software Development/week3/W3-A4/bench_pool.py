@@ -0,0 +1,93 @@
+# Author: Oshan Mendis
+# Description: Stress test of pooled CollegeDatabase - concurrent count_students_in_course
+#              readers while one thread bulk-inserts enrolments
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from CollegeDatabase import CollegeDatabase
+from bench_profiles import COURSES, build, quiet
+
+# Result columns and their format: counts as integers, rates and latencies as floats
+COLUMNS = [("reads/s", ",.0f"), ("p50 ms", ",.2f"), ("p95 ms", ",.2f"), ("p99 ms", ",.2f"),
+           ("rows", ",d"), ("rows/s", ",.0f"), ("checkouts", ",d"), ("waits", ",d"), ("mean wait ms", ",.2f")]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def run(path, pool_size, readers, duration, batch_size):
+    database = CollegeDatabase(path, "balanced", pool_size=pool_size)
+    stop = threading.Event()
+    latencies = [[] for _ in range(readers)]
+    written = [0]
+
+    def read(latency):
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            database.count_students_in_course(f"MSE{800 + i % COURSES}")
+            latency.append(time.perf_counter() - start)
+            i += 1
+
+    def write():
+        student = 1
+        while not stop.is_set():
+            rows = ({"student_id": student + n, "course_id": 1 + n % COURSES} for n in range(batch_size))
+            written[0] += database.insert_many("student_course", rows, batch_size)
+            student += batch_size
+
+    threads = [threading.Thread(target=read, args=(latency,)) for latency in latencies]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    stats = database.pool_stats()
+    database.close()
+    reads = [value for latency in latencies for value in latency]
+    return {
+        "reads/s": len(reads) / duration,
+        "p50 ms": statistics.median(reads) * 1000 if reads else 0.0,
+        "p95 ms": percentile(reads, 0.95) * 1000,
+        "p99 ms": percentile(reads, 0.99) * 1000,
+        "rows": written[0],
+        "rows/s": written[0] / duration,
+        "checkouts": stats["checkouts"],
+        "waits": stats["waits"],
+        "mean wait ms": stats["mean_wait_seconds"] * 1000,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress test the CollegeDatabase connection pool.")
+    parser.add_argument("--students", type=int, default=50_000, help="students and enrolments loaded first")
+    parser.add_argument("--readers", type=int, default=8, help="threads running count_students_in_course")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per pool size")
+    parser.add_argument("--batch-size", type=int, default=1_000, help="enrolments per insert_many call")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=None,
+                        help="pool sizes to compare (default: 1, readers / 2 and readers + 1)")
+    args = parser.parse_args()
+    pool_sizes = args.pool_sizes or sorted({1, max(1, args.readers // 2), args.readers + 1})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pool.db")
+        setup = CollegeDatabase(path, "bulk-load")
+        build(setup, args.students)
+        setup.close()
+
+        print(f"{args.readers} readers + 1 writer, {args.duration:g}s per run")
+        print(f"{'pool':>4}" + "".join(f"{column:>13}" for column, _ in COLUMNS))
+        for size in pool_sizes:
+            with quiet():
+                results = run(path, size, args.readers, args.duration, args.batch_size)
+            print(f"{size:>4}" + "".join(f"{results[column]:>13{spec}}" for column, spec in COLUMNS))
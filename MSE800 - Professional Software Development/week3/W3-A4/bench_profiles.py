@@ -0,0 +1,115 @@
+# Author: Oshan Mendis
+# Description: Insert/query throughput of each CollegeDatabase performance profile on the college schema
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+
+from CollegeDatabase import PROFILES, CollegeDatabase
+from bench_insert_many import STUDENT_COLUMNS, synthetic_students
+
+COLLEGE_SCHEMA = {
+    "student": STUDENT_COLUMNS,
+    "course": {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "course_name": "TEXT",
+        "course_code": "TEXT UNIQUE",
+        "description": "TEXT",
+        "category": "TEXT"
+    },
+    "teacher": {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "first_name": "TEXT",
+        "last_name": "TEXT",
+        "email": "TEXT UNIQUE",
+        "phone": "TEXT"
+    },
+    "student_course": {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "student_id": "INTEGER",
+        "course_id": "INTEGER",
+        "FOREIGN KEY(student_id)": "REFERENCES student(id)",
+        "FOREIGN KEY(course_id)": "REFERENCES course(id)"
+    },
+    "teacher_course": {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "teacher_id": "INTEGER",
+        "course_id": "INTEGER",
+        "FOREIGN KEY(teacher_id)": "REFERENCES teacher(id)",
+        "FOREIGN KEY(course_id)": "REFERENCES course(id)"
+    },
+}
+
+COURSES = 50
+
+
+@contextlib.contextmanager
+def quiet():
+    """CollegeDatabase prints on every write; keep that out of the timings."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def build(database, students):
+    """Creates the schema and loads courses, teachers, students and enrolments with insert_many."""
+    with quiet():
+        for table, columns in COLLEGE_SCHEMA.items():
+            database.create_table(table, columns)
+    database.insert_many("course", (
+        {"course_name": f"Course {c}", "course_code": f"MSE{800 + c}",
+         "description": "Benchmark course", "category": "Engineering"} for c in range(COURSES)))
+    database.insert_many("teacher", (
+        {"first_name": f"Teacher{t}", "last_name": "Bench", "email": f"teacher{t}@yoobee.com",
+         "phone": "555-0000"} for t in range(COURSES * 2)))
+    database.insert_many("student", synthetic_students(students), 10_000)
+    database.insert_many("student_course", (
+        {"student_id": s, "course_id": 1 + s % COURSES} for s in range(1, students + 1)), 10_000)
+    database.insert_many("teacher_course", (
+        {"teacher_id": t, "course_id": 1 + t % COURSES} for t in range(1, COURSES * 2 + 1)))
+
+
+def run_profile(directory, profile, students, single_rows, queries):
+    database = CollegeDatabase(os.path.join(directory, f"{profile}.db"), profile)
+    results = {}
+
+    start = time.perf_counter()
+    build(database, students)
+    results["bulk rows/s"] = (students * 2 + COURSES * 4) / (time.perf_counter() - start)
+
+    # One commit per row: this is where journal_mode and synchronous matter most
+    start = time.perf_counter()
+    with quiet():
+        for row in synthetic_students(single_rows, start=students):
+            database.insert_record("student", row)
+    results["single rows/s"] = single_rows / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(queries):
+        database.count_students_in_course(f"MSE{800 + i % COURSES}")
+    results["count q/s"] = queries / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(queries):
+        database.list_teachers_for_course(f"MSE{800 + i % COURSES}")
+    results["teachers q/s"] = queries / (time.perf_counter() - start)
+
+    database.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CollegeDatabase performance profiles.")
+    parser.add_argument("--students", type=int, default=100_000, help="students loaded with insert_many")
+    parser.add_argument("--single-rows", type=int, default=1_000, help="students inserted one commit at a time")
+    parser.add_argument("--queries", type=int, default=200, help="runs of each course query")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    args = parser.parse_args()
+
+    columns = ["bulk rows/s", "single rows/s", "count q/s", "teachers q/s"]
+    print(f"{'profile':<10}" + "".join(f"{column:>15}" for column in columns))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.profiles:
+            results = run_profile(tmp, name, args.students, args.single_rows, args.queries)
+            print(f"{name:<10}" + "".join(f"{results[column]:>15,.0f}" for column in columns))
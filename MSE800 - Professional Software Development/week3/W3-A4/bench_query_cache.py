@@ -0,0 +1,48 @@
+# Author: Oshan Mendis
+# Description: Dashboard-style read load (a few hot course codes, rare enrolments)
+#              with and without the CollegeDatabase query cache
+
+import argparse
+import os
+import tempfile
+import time
+
+from CollegeDatabase import CollegeDatabase
+from bench_profiles import build, quiet
+
+
+def run(path, lookups, hot_courses, write_every, cache_size):
+    database = CollegeDatabase(path, "balanced", query_cache_size=cache_size)
+    start = time.perf_counter()
+    with quiet():
+        for i in range(lookups):
+            code = f"MSE{800 + i % hot_courses}"
+            database.count_students_in_course(code)
+            database.list_teachers_for_course(code)
+            if write_every and i % write_every == write_every - 1:
+                database.insert_record("student_course", {"student_id": i, "course_id": 1 + i % hot_courses})
+    elapsed = time.perf_counter() - start
+    stats = database.query_cache_stats()
+    database.close()
+    return lookups * 2 / elapsed, stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CollegeDatabase query cache.")
+    parser.add_argument("--students", type=int, default=100_000, help="students and enrolments loaded first")
+    parser.add_argument("--lookups", type=int, default=20_000, help="dashboard refreshes (count + teacher list)")
+    parser.add_argument("--hot-courses", type=int, default=5, help="distinct course codes queried")
+    parser.add_argument("--write-every", type=int, default=500, help="one enrolment per this many refreshes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.db")
+        setup = CollegeDatabase(db_path, "bulk-load")
+        build(setup, args.students)
+        setup.close()
+
+        uncached, _ = run(db_path, args.lookups, args.hot_courses, args.write_every, 0)
+        print(f"no query cache : {uncached:>12,.0f} queries/s")
+        cached, stats = run(db_path, args.lookups, args.hot_courses, args.write_every, 1024)
+        print(f"query cache    : {cached:>12,.0f} queries/s  ({cached / uncached:.1f}x), "
+              f"hit ratio {stats['hit_ratio']:.1%}, {stats['invalidations']} invalidations")
@@ -0,0 +1,56 @@
+# Author: Oshan Mendis
+# Description: Micro-benchmark of insert_record with and without the generated-SQL cache
+
+import argparse
+import time
+
+from CollegeDatabase import CACHED_STATEMENTS, CollegeDatabase, _build_sql
+from bench_insert_many import STUDENT_COLUMNS
+from bench_profiles import quiet
+
+ROW = {"first_name": "Oshan", "last_name": "Mendis", "dob": "1995-10-23", "email": None}
+
+
+def time_inserts(calls, cache_sql, cached_statements):
+    """insert_record calls into an in-memory table inside one transaction, so SQL handling is what is timed."""
+    database = CollegeDatabase(":memory:", cache_sql=cache_sql, cached_statements=cached_statements)
+    with quiet():
+        database.create_table("student", STUDENT_COLUMNS)
+        start = time.perf_counter()
+        with database.transaction():
+            for _ in range(calls):
+                database.insert_record("student", ROW)
+        elapsed = time.perf_counter() - start
+    database.close()
+    return elapsed
+
+
+def time_build(calls, build):
+    columns = tuple(ROW)
+    start = time.perf_counter()
+    for _ in range(calls):
+        build("insert", "student", columns)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CollegeDatabase SQL text cache.")
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.calls:,} calls")
+    uncached = time_build(args.calls, _build_sql.__wrapped__)
+    cached = time_build(args.calls, _build_sql)
+    print(f"SQL text only   uncached {uncached:6.2f}s  cached {cached:6.2f}s  ({uncached / cached:.1f}x)")
+
+    scenarios = [
+        ("no SQL cache", False, CACHED_STATEMENTS),
+        ("SQL cache", True, CACHED_STATEMENTS),
+        ("SQL cache, cached_statements=0", True, 0),
+    ]
+    baseline = None
+    for label, cache_sql, statements in scenarios:
+        elapsed = time_inserts(args.calls, cache_sql, statements)
+        baseline = baseline or elapsed
+        print(f"insert_record {label:<32} {elapsed:6.2f}s  {args.calls / elapsed:>10,.0f} calls/s  "
+              f"({baseline / elapsed:.2f}x)")
@@ -0,0 +1,74 @@
+# Author: Oshan Mendis
+# Description: Peak memory of exporting the enrolment table with fetch_all vs iter_all,
+#              and page latency of keyset pagination vs LIMIT/OFFSET at increasing depth
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+
+from CollegeDatabase import CollegeDatabase
+from bench_profiles import COLLEGE_SCHEMA, quiet
+
+
+def build(path, enrolments):
+    database = CollegeDatabase(path, "bulk-load")
+    with quiet():
+        database.create_table("student_course", COLLEGE_SCHEMA["student_course"])
+    database.insert_many("student_course", (
+        {"student_id": 1 + i // 4, "course_id": 1 + i % 50} for i in range(enrolments)), 50_000)
+    database.set_profile("durable")
+    return database
+
+
+def export(rows):
+    """Writes rows as CSV to the null device, the way an export job would stream them out."""
+    with open(os.devnull, "w", newline="") as sink:
+        writer = csv.writer(sink)
+        for row in rows:
+            writer.writerow(row)
+
+
+def measure(label, make_rows):
+    tracemalloc.start()
+    start = time.perf_counter()
+    export(make_rows())
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<22} {elapsed:7.2f}s  peak {peak / 1024 / 1024:8.1f} MB")
+
+
+def time_page(database, depth, limit, keyset):
+    start = time.perf_counter()
+    if keyset:
+        database.page_after("student_course", depth, limit)
+    else:
+        database.cursor.execute("SELECT * FROM student_course ORDER BY id LIMIT ? OFFSET ?", (limit, depth))
+        database.cursor.fetchall()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streaming and paginated reads.")
+    parser.add_argument("--enrolments", type=int, default=2_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = build(os.path.join(tmp, "streaming.db"), args.enrolments)
+        print(f"Exporting {args.enrolments:,} enrolments")
+        measure("fetch_all", lambda: database.fetch_all("student_course"))
+        measure("iter_all", lambda: database.iter_all("student_course"))
+        measure("iter_all as_rows", lambda: database.iter_all("student_course", as_rows=True))
+
+        print(f"\nPage of {args.page_size} rows at depth   keyset      offset")
+        depth = 1
+        while depth < args.enrolments:
+            keyset = time_page(database, depth, args.page_size, keyset=True)
+            offset = time_page(database, depth, args.page_size, keyset=False)
+            print(f"{depth:>32,} {keyset:8.3f}ms {offset:9.3f}ms")
+            depth *= 10
+        database.close()
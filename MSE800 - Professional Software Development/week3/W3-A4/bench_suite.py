@@ -0,0 +1,286 @@
+# Author: Oshan Mendis
+# Description: Benchmark suite for the CollegeDatabase layer on the college (W3-A4) and clinic (W3-A5) schemas.
+#              Generates synthetic data at a chosen scale, times each CRUD method and the report queries,
+#              and can write cProfile output or compare against a saved baseline.
+#
+# Usage:
+#   python bench_suite.py --schema both --scale 100000 --ops 2000
+#   python bench_suite.py --scale 1000000 --save baseline.json
+#   python bench_suite.py --scale 1000000 --baseline baseline.json --tolerance 0.2
+#   python bench_suite.py --schema college --cprofile college.prof
+
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import random
+import sys
+import tempfile
+import time
+
+from CollegeDatabase import PROFILES, CollegeDatabase
+from bench_insert_many import synthetic_students
+from bench_profiles import COLLEGE_SCHEMA, quiet
+
+CLINIC_SCHEMA = {
+    "patient": {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "first_name": "TEXT",
+        "last_name": "TEXT",
+        "age": "INTEGER",
+        "gender": "TEXT",
+        "phone": "TEXT",
+        "email": "TEXT UNIQUE"
+    },
+    "doctor": {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "first_name": "TEXT",
+        "last_name": "TEXT",
+        "specialization": "TEXT",
+        "phone": "TEXT",
+        "email": "TEXT UNIQUE"
+    },
+}
+
+CLINIC_INDEXES = {"patient": ["age"], "doctor": ["specialization"]}
+
+SPECIALIZATIONS = ["Ophthalmology", "Cardiology", "Dermatology", "General Practice", "Paediatrics",
+                   "Neurology", "Orthopaedics"]
+
+LOAD_BATCH_SIZE = 50_000
+
+
+def college_sizes(scale):
+    courses = max(10, scale // 1000)
+    return {"students": scale, "courses": courses, "teachers": courses * 2, "enrolments": scale * 2}
+
+
+def generate_college(database, scale, rng):
+    """Loads `scale` students, 2 enrolments each, one course per 1000 students and two teachers per course."""
+    sizes = college_sizes(scale)
+    courses, teachers = sizes["courses"], sizes["teachers"]
+    with quiet():
+        for table, columns in COLLEGE_SCHEMA.items():
+            database.create_table(table, columns)
+    database.insert_many("course", (
+        {"course_name": f"Course {c}", "course_code": f"MSE{800 + c}",
+         "description": "Synthetic course", "category": rng.choice(["Engineering", "Research", "Design"])}
+        for c in range(courses)))
+    database.insert_many("teacher", (
+        {"first_name": f"Teacher{t}", "last_name": f"Staff{t % 97}", "email": f"teacher{t}@yoobee.com",
+         "phone": f"555-{t % 10000:04d}"} for t in range(teachers)))
+    database.insert_many("student", synthetic_students(scale), LOAD_BATCH_SIZE)
+    database.insert_many("student_course", (
+        {"student_id": 1 + s, "course_id": 1 + rng.randrange(courses)} for s in range(scale) for _ in range(2)),
+        LOAD_BATCH_SIZE)
+    database.insert_many("teacher_course", (
+        {"teacher_id": 1 + t, "course_id": 1 + t % courses} for t in range(teachers)))
+    return sizes
+
+
+def synthetic_patients(count, rng, start=0):
+    for i in range(start, start + count):
+        yield {
+            "first_name": f"Patient{i}",
+            "last_name": f"Family{i % 5000}",
+            "age": rng.randint(0, 100),
+            "gender": rng.choice(["F", "M", "X"]),
+            "phone": f"021-{i % 10_000_000:07d}",
+            "email": f"patient{i}@clinic.example"
+        }
+
+
+def generate_clinic(database, scale, rng):
+    """Loads `scale` patients and one doctor per 100 patients across the specializations."""
+    doctors = max(len(SPECIALIZATIONS), scale // 100)
+    with quiet():
+        for table, columns in CLINIC_SCHEMA.items():
+            database.create_table(table, columns, CLINIC_INDEXES[table])
+    database.insert_many("patient", synthetic_patients(scale, rng), LOAD_BATCH_SIZE)
+    database.insert_many("doctor", (
+        {"first_name": f"Doctor{d}", "last_name": f"Medic{d % 97}",
+         "specialization": SPECIALIZATIONS[d % len(SPECIALIZATIONS)],
+         "phone": f"09-{d:07d}", "email": f"doctor{d}@clinic.example"} for d in range(doctors)), LOAD_BATCH_SIZE)
+    return {"patients": scale, "doctors": doctors}
+
+
+def college_operations(database, sizes, rng):
+    """(name, share of --ops, rows per call, callable taking the call number)."""
+    students, courses = sizes["students"], sizes["courses"]
+    new_students = synthetic_students(10 ** 9, start=students)  # unique emails past the generated ones
+    inserted = []
+
+    def insert_record(_):
+        database.insert_record("student", next(new_students))
+        inserted.append(database.cursor.lastrowid)
+
+    def delete_record(_):
+        if inserted:
+            database.delete_record_by_condition("student", "id = ?", (inserted.pop(),))
+
+    def insert_many(_):
+        database.insert_many("student", (next(new_students) for _ in range(1000)))
+
+    def course_code():
+        return f"MSE{800 + rng.randrange(courses)}"
+
+    return [
+        ("insert_record", 1.0, 1, insert_record),
+        ("insert_many x1000", 0.05, 1000, insert_many),
+        ("fetch_by_condition id", 1.0, 1,
+         lambda _: database.fetch_by_condition("student", "id = ?", (1 + rng.randrange(students),))),
+        ("iter_where course", 0.1, sizes["enrolments"] // courses,
+         lambda _: sum(1 for _ in database.iter_where("student_course", "course_id = ?",
+                                                      (1 + rng.randrange(courses),)))),
+        ("page_after x100", 1.0, 100,
+         lambda _: database.page_after("student", rng.randrange(students), 100)),
+        ("update_record", 1.0, 1,
+         lambda n: database.update_record("student", {"last_name": f"Updated{n}"}, "id = ?",
+                                          (1 + rng.randrange(students),))),
+        ("delete_record", 1.0, 1, delete_record),
+        ("count_students_in_course", 1.0, 1, lambda _: database.count_students_in_course(course_code())),
+        ("list_teachers_for_course", 1.0, 1, lambda _: database.list_teachers_for_course(course_code())),
+    ]
+
+
+def clinic_operations(database, sizes, rng):
+    patients = sizes["patients"]
+    new_patients = synthetic_patients(10 ** 9, rng, start=patients)
+    inserted = []
+
+    def insert_record(_):
+        database.insert_record("patient", next(new_patients))
+        inserted.append(database.cursor.lastrowid)
+
+    def delete_record(_):
+        if inserted:
+            database.delete_record_by_condition("patient", "id = ?", (inserted.pop(),))
+
+    return [
+        ("insert_record", 1.0, 1, insert_record),
+        ("fetch_by_condition id", 1.0, 1,
+         lambda _: database.fetch_by_condition("patient", "id = ?", (1 + rng.randrange(patients),))),
+        # The two W3-A5 report queries: all senior patients, and the number of ophthalmologists
+        ("senior patients (age > 65)", 0.01, patients * 35 // 101,
+         lambda _: sum(1 for _ in database.iter_where("patient", "age > ?", (65,)))),
+        ("count ophthalmologists", 1.0, 1,
+         lambda _: len(database.fetch_by_condition("doctor", "specialization = ?", ("Ophthalmology",)))),
+        ("update_record", 1.0, 1,
+         lambda n: database.update_record("patient", {"phone": f"022-{n:07d}"}, "id = ?",
+                                          (1 + rng.randrange(patients),))),
+        ("delete_record", 1.0, 1, delete_record),
+    ]
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_operations(schema, operations, ops, profiler):
+    """
+    Times every operation, then - with a profiler - runs them all again under cProfile in a separate,
+    untimed pass, so the profiler's overhead never reaches the timings compared with --baseline.
+    """
+    results = []
+    for name, share, rows, operation in operations:
+        calls = max(1, int(ops * share))
+        timings = []
+        with quiet():
+            for n in range(calls):
+                start = time.perf_counter()
+                operation(n)
+                timings.append(time.perf_counter() - start)
+        timings.sort()
+        total = sum(timings)
+        results.append({
+            "schema": schema, "operation": name, "calls": calls, "rows_per_call": rows,
+            "ops_per_sec": calls / total if total else 0.0,
+            "p50_us": percentile(timings, 0.50) * 1e6,
+            "p95_us": percentile(timings, 0.95) * 1e6,
+            "p99_us": percentile(timings, 0.99) * 1e6,
+            "max_us": timings[-1] * 1e6,
+        })
+
+    if profiler:
+        with quiet():
+            for name, share, rows, operation in operations:
+                profiler.enable()
+                for n in range(max(1, int(ops * share))):
+                    operation(n)
+                profiler.disable()
+    return results
+
+
+def print_results(results):
+    print(f"{'schema':<8} {'operation':<28} {'calls':>7} {'ops/s':>12} {'p50 us':>10} {'p95 us':>10} "
+          f"{'p99 us':>10} {'max us':>10}")
+    for r in results:
+        print(f"{r['schema']:<8} {r['operation']:<28} {r['calls']:>7,} {r['ops_per_sec']:>12,.1f} "
+              f"{r['p50_us']:>10,.1f} {r['p95_us']:>10,.1f} {r['p99_us']:>10,.1f} {r['max_us']:>10,.1f}")
+
+
+def compare(results, baseline_path, tolerance):
+    """Prints operations whose ops/s dropped by more than `tolerance` against a saved run; returns their count."""
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = {(r["schema"], r["operation"]): r for r in json.load(baseline_file)["results"]}
+    regressions = 0
+    for r in results:
+        before = baseline.get((r["schema"], r["operation"]))
+        if before and r["ops_per_sec"] < before["ops_per_sec"] * (1 - tolerance):
+            regressions += 1
+            print(f"REGRESSION {r['schema']} {r['operation']}: {before['ops_per_sec']:,.1f} -> "
+                  f"{r['ops_per_sec']:,.1f} ops/s")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CollegeDatabase layer.")
+    parser.add_argument("--schema", choices=["college", "clinic", "both"], default="both")
+    parser.add_argument("--scale", type=int, default=100_000,
+                        help="students / patients to generate (1K to 10M)")
+    parser.add_argument("--ops", type=int, default=1_000, help="calls per operation (heavy ones run fewer)")
+    parser.add_argument("--profile", choices=list(PROFILES), default="balanced", help="SQLite performance profile")
+    parser.add_argument("--seed", type=int, default=800)
+    parser.add_argument("--db-dir", help="keep the generated databases here instead of a temporary directory")
+    parser.add_argument("--cprofile", metavar="PATH", help="write cProfile stats from a second, untimed pass over the operations")
+    parser.add_argument("--save", metavar="PATH", help="save results as JSON, e.g. as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with saved results; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed ops/s drop against the baseline")
+    args = parser.parse_args()
+
+    schemas = ["college", "clinic"] if args.schema == "both" else [args.schema]
+    generators = {"college": (generate_college, college_operations),
+                  "clinic": (generate_clinic, clinic_operations)}
+    profiler = cProfile.Profile() if args.cprofile else None
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.db_dir or tmp
+        for schema in schemas:
+            generate, operations = generators[schema]
+            rng = random.Random(args.seed)
+            path = os.path.join(directory, f"bench_{schema}_{args.scale}.db")
+            if os.path.exists(path):
+                os.remove(path)
+
+            database = CollegeDatabase(path, "bulk-load")
+            start = time.perf_counter()
+            sizes = generate(database, args.scale, rng)
+            print(f"{schema}: generated {sizes} in {time.perf_counter() - start:.1f}s")
+            database.set_profile(args.profile)
+            results += run_operations(schema, operations(database, sizes, rng), args.ops, profiler)
+            database.close()
+
+    print()
+    print_results(results)
+
+    if profiler:
+        profiler.dump_stats(args.cprofile)
+        print(f"\ncProfile stats written to {args.cprofile}; top functions by cumulative time:")
+        pstats.Stats(args.cprofile).sort_stats("cumulative").print_stats(15)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as save_file:
+            json.dump({"scale": args.scale, "profile": args.profile, "results": results}, save_file, indent=2)
+    if args.baseline and compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
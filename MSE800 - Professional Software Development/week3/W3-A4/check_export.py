@@ -0,0 +1,123 @@
+# Author: Oshan Mendis
+# Description: Regression checks for CollegeExport column types when values change type between chunks.
+#              Exits with status 1 if any check fails.
+#
+# Usage:
+#   python check_export.py
+
+import os
+import sys
+import tempfile
+
+from CollegeDatabase import CollegeDatabase
+from CollegeExport import export_parquet, iter_numpy_chunks, iter_record_batches
+from QueryMetrics import HistogramSink
+from bench_profiles import quiet
+
+# An integer first and a float after it: with chunk_size=1 they land in different chunks
+FEES = {"id": "INTEGER PRIMARY KEY", "fee": "NUMERIC"}
+FEE_ROWS = [{"id": 1, "fee": 100}, {"id": 2, "fee": 5.5}, {"id": 3, "fee": None}]
+
+
+def fee_database(rows=FEE_ROWS):
+    database = CollegeDatabase(":memory:")
+    with quiet():
+        database.create_table("fees", FEES)
+        for row in rows:
+            database.insert_record("fees", row)
+    return database
+
+
+def int_then_float_arrow():
+    """A NUMERIC column holding 100 then 5.5 exports as float64, without truncating 5.5."""
+    database = fee_database()
+    batches = list(iter_record_batches(database, "fees", chunk_size=1))
+    database.close()
+    fees = [value for batch in batches for value in batch.column("fee").to_pylist()]
+    return str(batches[0].schema.field("fee").type) == "double" and fees == [100.0, 5.5, None]
+
+
+def int_then_float_query():
+    """The same for a SELECT query, where there is no declared type to go on."""
+    database = fee_database()
+    batches = list(iter_record_batches(database, "SELECT id, fee * 1 AS fee FROM fees ORDER BY id", chunk_size=1))
+    database.close()
+    fees = [value for batch in batches for value in batch.column("fee").to_pylist()]
+    return str(batches[0].schema.field("fee").type) == "double" and fees == [100.0, 5.5, None]
+
+
+def int_then_float_parquet():
+    """Parquet keeps one schema for the whole file, so it must already be float64 at the first chunk."""
+    import pyarrow.parquet as pq
+
+    database = fee_database()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fees.parquet")
+        export_parquet(database, "fees", path, chunk_size=1)
+        fees = pq.read_table(path).column("fee").to_pylist()
+    database.close()
+    return fees == [100.0, 5.5, None]
+
+
+def int_then_float_numpy():
+    database = fee_database()
+    chunks = list(iter_numpy_chunks(database, "fees", chunk_size=1))
+    database.close()
+    return chunks[0].dtype["fee"].kind == "f" and chunks[1]["fee"][0] == 5.5
+
+
+def text_in_integer_column():
+    """SQLite stores 'n/a' in an INTEGER column as text; the column then exports as strings."""
+    database = CollegeDatabase(":memory:")
+    with quiet():
+        database.create_table("marks", {"id": "INTEGER PRIMARY KEY", "mark": "INTEGER"})
+        database.insert_record("marks", {"id": 1, "mark": 72})
+        database.insert_record("marks", {"id": 2, "mark": "n/a"})
+    batches = list(iter_record_batches(database, "marks", chunk_size=1))
+    database.close()
+    marks = [value for batch in batches for value in batch.column("mark").to_pylist()]
+    return marks == ["72", "n/a"]
+
+
+def null_first_chunk():
+    """A first chunk with only NULLs does not fix the column type."""
+    database = fee_database([{"id": 1, "fee": None}, {"id": 2, "fee": 5.5}])
+    batches = list(iter_record_batches(database, "SELECT fee FROM fees ORDER BY id", chunk_size=1))
+    database.close()
+    return [value for batch in batches for value in batch.column("fee").to_pylist()] == [None, 5.5]
+
+
+def export_is_instrumented():
+    """instrument() sees the export's statements, with the rows it read."""
+    database = fee_database()
+    histogram = HistogramSink()
+    database.instrument(histogram)
+    list(iter_record_batches(database, "fees", chunk_size=1))
+    database.close()
+    report = histogram.report()
+    return (any(row["sql"] == "SELECT * FROM \"fees\"" and row["rows"] == 3 for row in report)
+            and any(row["sql"].startswith("PRAGMA table_info") for row in report))
+
+
+CHECKS = {
+    "NUMERIC int then float, RecordBatches": int_then_float_arrow,
+    "int then float from a query, RecordBatches": int_then_float_query,
+    "NUMERIC int then float, Parquet": int_then_float_parquet,
+    "NUMERIC int then float, NumPy": int_then_float_numpy,
+    "text in an INTEGER column": text_in_integer_column,
+    "first chunk all NULL": null_first_chunk,
+    "export statements reach instrument()": export_is_instrumented,
+}
+
+
+if __name__ == "__main__":
+    failures = 0
+    for name, check in CHECKS.items():
+        try:
+            passed = check()
+        except Exception as e:
+            passed = False
+            print(f"  {type(e).__name__}: {e}")
+        failures += not passed
+        print(f"{'ok  ' if passed else 'FAIL'} {name}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,69 @@
+# Author: Oshan Mendis
+# Description: Regression checks for CollegeDatabase transaction handling after failed writes.
+#              Exits with status 1 if any check fails.
+#
+# Usage:
+#   python check_transactions.py
+
+import sys
+
+from CollegeDatabase import CollegeDatabase
+from bench_profiles import quiet
+
+STUDENT = {"id": "INTEGER PRIMARY KEY", "email": "TEXT UNIQUE"}
+
+
+def failed_write_then_transaction(write):
+    """A failing write outside transaction() must not leave an implicit transaction open."""
+    database = CollegeDatabase(":memory:")
+    with quiet():
+        database.create_table("student", STUDENT)
+        database.insert_record("student", {"id": 1, "email": "a@yoobee.com"})
+        database.insert_record("student", {"id": 2, "email": "b@yoobee.com"})
+        write(database)
+        left_open = database.conn.in_transaction
+        with database.transaction():
+            database.insert_record("student", {"id": 3, "email": "c@yoobee.com"})
+    rows = len(database.fetch_all("student"))
+    database.close()
+    return not left_open and rows == 3
+
+
+def raw_write_then_transaction():
+    """An uncommitted conn.execute() write is kept, not lost, when a transaction() block starts."""
+    database = CollegeDatabase(":memory:")
+    with quiet():
+        database.create_table("student", STUDENT)
+        database.conn.execute("INSERT INTO student (id, email) VALUES (1, 'a@yoobee.com')")
+        with database.transaction():
+            database.insert_record("student", {"id": 2, "email": "b@yoobee.com"})
+    rows = len(database.fetch_all("student"))
+    database.close()
+    return rows == 2
+
+
+CHECKS = {
+    "duplicate insert_record, then transaction()":
+        lambda: failed_write_then_transaction(
+            lambda db: db.insert_record("student", {"id": 9, "email": "a@yoobee.com"})),
+    "failing update_record, then transaction()":
+        lambda: failed_write_then_transaction(
+            lambda db: db.update_record("student", {"email": "a@yoobee.com"}, "id = ?", (2,))),
+    "failing delete_record_by_condition, then transaction()":
+        lambda: failed_write_then_transaction(
+            lambda db: db.delete_record_by_condition("student", "no_such_column = ?", (1,))),
+    "raw conn.execute() write, then transaction()": raw_write_then_transaction,
+}
+
+
+if __name__ == "__main__":
+    failures = 0
+    for name, check in CHECKS.items():
+        try:
+            passed = check()
+        except Exception as e:
+            passed = False
+            print(f"  {type(e).__name__}: {e}")
+        failures += not passed
+        print(f"{'ok  ' if passed else 'FAIL'} {name}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,34 @@
+# Author: Oshan Mendis
+# Description: Enable, check or rebuild the trigger-maintained course_stats counters of a college database
+
+import argparse
+import sqlite3
+import sys
+
+from CollegeDatabase import CollegeDatabase
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the course_stats enrolment counters.")
+    parser.add_argument("command", choices=["enable", "check", "rebuild"])
+    parser.add_argument("--db", default="yoobee_college.db", help="college database file")
+    args = parser.parse_args()
+
+    database = CollegeDatabase(args.db)
+    failed = False
+    try:
+        if args.command == "enable":
+            database.enable_course_stats()
+        elif args.command == "rebuild":
+            database.rebuild_course_stats()
+        else:
+            mismatches = database.check_course_stats()
+            for course_id, stored, actual in mismatches:
+                print(f"Course {course_id}: stored students/teachers {stored}, actual {actual}")
+            print("Course stats are consistent." if not mismatches else
+                  f"{len(mismatches)} course(s) out of date; run `python course_stats.py rebuild`.")
+            failed = bool(mismatches)
+    except sqlite3.Error as e:
+        print(f"Error running '{args.command}' on {args.db}: {e}")
+        failed = True
+    database.close()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,88 @@
+# Author: Oshan Mendis
+# Description: Character counting on demo_file.txt repeated up to several GB -
+#              the original readlines() loop vs the mmap, chunk-parallel FileReader.find_char_count,
+#              and one char_histogram pass vs one find_char_count pass per character
+#
+# Usage:
+#   python bench_read_file.py --size-mb 4096
+#   python bench_read_file.py --size-mb 4096 --workers 8 --legacy-limit-mb 1024
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from ReadFile import FileReader
+
+DEMO_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "demo_file.txt")
+
+
+def legacy_char_count(file_path, character):
+    # find_char_count as it was: every line becomes a str, and the whole list stays in memory
+    count = 0
+    with open(file_path, "r", encoding="utf-8") as data:
+        lines = data.readlines()
+        for line in lines:
+            if character in line:
+                count += line.count(character)
+    return count
+
+
+def build(path, size_mb):
+    """Appends copies of demo_file.txt until the file reaches size_mb."""
+    target = size_mb * 1024 * 1024
+    with open(path, "wb") as out:
+        while out.tell() < target:
+            with open(DEMO_FILE, "rb") as demo:
+                shutil.copyfileobj(demo, out)
+    return os.path.getsize(path)
+
+
+def timed(label, size, count_chars):
+    start = time.perf_counter()
+    count = count_chars()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:8.2f}s  {size / elapsed / 1e6:>8,.0f} MB/s  count={count:,}")
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark FileReader.find_char_count.")
+    parser.add_argument("--size-mb", type=int, default=2048, help="size of the generated file")
+    parser.add_argument("--character", default="*")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="process pool size")
+    parser.add_argument("--legacy-limit-mb", type=int, default=1024,
+                        help="skip the readlines() version above this size, it holds the whole file in memory")
+    parser.add_argument("--histogram-chars", default="etaoinshrdlu*.,;!?",
+                        help="characters counted one pass each, then in a single char_histogram pass")
+    parser.add_argument("--dir", help="where to write the generated file (default: a temporary directory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        path = os.path.join(tmp, "demo_scaled.txt")
+        size = build(path, args.size_mb)
+        print(f"{size / 1e6:,.0f} MB, counting {args.character!r}, {args.workers} workers")
+        reader = FileReader(path)
+
+        results = []
+        if args.size_mb <= args.legacy_limit_mb:
+            results.append(timed("readlines() (original)", size, lambda: legacy_char_count(path, args.character)))
+        else:
+            print(f"readlines() (original) skipped above {args.legacy_limit_mb} MB")
+        results.append(timed("mmap, single process", size, lambda: reader.find_char_count(args.character, workers=1)))
+        results.append(timed(f"mmap, {args.workers} processes", size,
+                             lambda: reader.find_char_count(args.character, workers=args.workers)))
+        assert len(set(results)) == 1, "counts differ"
+
+        chars = args.histogram_chars
+        print()
+        start = time.perf_counter()
+        separate = {char: reader.find_char_count(char, workers=args.workers) for char in chars}
+        elapsed = time.perf_counter() - start
+        print(f"{'find_char_count x ' + str(len(chars)):<32} {elapsed:8.2f}s")
+        start = time.perf_counter()
+        histogram = reader.char_histogram(chars, workers=args.workers)
+        single = time.perf_counter() - start
+        print(f"{'char_histogram, one pass':<32} {single:8.2f}s  ({elapsed / single:.1f}x)")
+        assert histogram == separate, "counts differ"
@@ -0,0 +1,132 @@
+"""
+Asyncio engine for analysing many CVs concurrently.
+
+AsyncCVAnalyzer uses the async surface of the Gemini client (client.aio) and
+keeps the number of in-flight requests under a semaphore. A token-bucket rate
+limiter holds requests back to the account's requests/min and tokens/min quotas,
+and 429 / 5xx responses are retried with jittered exponential backoff.
+
+Example:
+    analyzer = AsyncCVAnalyzer(max_concurrency=8, requests_per_minute=60)
+    results = asyncio.run(analyzer.analyze_many(cv_texts))
+"""
+
+import asyncio
+import random
+import time
+
+from google.genai import errors, types
+
+from gemini_client import get_client
+from main import MODEL_NAME, SYSTEM_INSTRUCTION, build_prompt
+from preprocess import estimate_tokens
+
+
+class TokenBucket:
+    """A bucket holding up to `capacity` tokens that refills at `rate` tokens per second."""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount=1):
+        """Waits until `amount` tokens are available and takes them."""
+        # A single request bigger than the whole bucket would otherwise wait forever
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+
+class RateLimiter:
+    """Applies requests-per-minute and tokens-per-minute quotas. Either may be None (unlimited)."""
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60) if tokens_per_minute else None
+
+    async def acquire(self, token_count):
+        if self.requests:
+            await self.requests.acquire(1)
+        if self.tokens:
+            await self.tokens.acquire(token_count)
+
+
+def is_retryable(error):
+    """True for throttling (429) and server-side (5xx) API errors."""
+    return isinstance(error, errors.APIError) and (error.code == 429 or error.code >= 500)
+
+
+class AsyncCVAnalyzer:
+    def __init__(self, client=None, base_url=None, max_concurrency=8, requests_per_minute=None,
+                 tokens_per_minute=None, max_retries=5, base_delay=1.0, max_delay=30.0):
+        """
+        client: a genai.Client to use; defaults to the shared gemini_client.get_client(base_url)
+        base_url: alternative API endpoint, e.g. a local FakeGeminiServer
+        max_concurrency: maximum number of requests in flight at once
+        requests_per_minute / tokens_per_minute: quota limits (None means unlimited)
+        max_retries: retries after the first attempt for 429 / 5xx responses
+        base_delay / max_delay: backoff bounds in seconds
+        """
+        self.client = client or get_client(base_url)
+        self.max_concurrency = max_concurrency
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"calls": 0, "retries": 0, "failures": 0}
+        self._semaphore = None
+
+    def _backoff(self, attempt):
+        """Full-jitter exponential backoff: a random delay up to base_delay * 2^attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def analyze(self, cv_text):
+        """Analyses one CV, retrying throttled or failed requests. Returns the response text."""
+        # Created lazily so the semaphore belongs to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        prompt = build_prompt(cv_text)
+        token_count = estimate_tokens(SYSTEM_INSTRUCTION + prompt)
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.limiter.acquire(token_count)
+                self.stats["calls"] += 1
+                try:
+                    response = await self.client.aio.models.generate_content(
+                        model=MODEL_NAME,
+                        config=types.GenerateContentConfig(system_instruction=SYSTEM_INSTRUCTION),
+                        contents=prompt,
+                    )
+                    return response.text
+                except errors.APIError as e:
+                    if not is_retryable(e) or attempt == self.max_retries:
+                        self.stats["failures"] += 1
+                        raise
+                    self.stats["retries"] += 1
+                    await asyncio.sleep(self._backoff(attempt))
+
+    async def analyze_many(self, cv_texts):
+        """
+        Analyses all CVs concurrently and returns results in input order.
+        A CV that still fails after its retries has the exception in its slot instead of text.
+        """
+        return await asyncio.gather(*(self.analyze(text) for text in cv_texts), return_exceptions=True)
+
+async def analyze_cv_async(cv_text, analyzer=None):
+    """Async counterpart of main.analyze_cv."""
+    analyzer = analyzer or AsyncCVAnalyzer(max_concurrency=1)
+    return await analyzer.analyze(cv_text)
@@ -0,0 +1,252 @@
+"""
+Batch mode for the CV analyzer.
+
+Extracts text from every CV in a directory (or matching a glob) on a process
+pool, while analysis threads consume the extracted text through a bounded
+queue. This lets CPU-bound PDF/DOCX parsing overlap with the network-bound
+Gemini calls. Each CV produces one JSON line in the output file, and CVs that
+already have a successful result are skipped, so an interrupted run can simply
+be started again. With --cache, unchanged CVs skip both extraction and
+analysis (see cache.py). With --compact, workers also strip whitespace and
+repeated headers/footers and split long CVs into chunks (see preprocess.py).
+With --structured, each analysis is a JSON object (see structured.py) that
+--results-db loads into an indexed SQLite store (see results_store.py).
+
+Usage:
+    python batch.py cvs/ -o results.jsonl --workers 4
+    python batch.py "intake/**/*.pdf" -o results.jsonl
+"""
+
+import argparse
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cache import TEXT, CVCache, file_sha256
+from main import EXTRACTORS, PROMPT_TEMPLATE, analyze_cv, extract_pages, extract_text
+from preprocess import PreparedCV, analyze_prepared, prepare_cv
+
+# Marks the end of the extraction stream for the analysis threads
+_DONE = object()
+
+
+def find_cv_files(target):
+    """Returns the sorted list of supported CV files in a directory or matching a glob."""
+    if os.path.isdir(target):
+        paths = []
+        for root, _, files in os.walk(target):
+            paths.extend(os.path.join(root, name) for name in files)
+    else:
+        paths = glob.glob(target, recursive=True)
+
+    return sorted(
+        path for path in paths
+        if os.path.isfile(path) and os.path.splitext(path)[1].lower() in EXTRACTORS
+    )
+
+
+def load_completed(output_path):
+    """Returns the paths that already have a successful result in the JSONL file."""
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+
+    with open(output_path, "r", encoding="utf-8") as results:
+        for line in results:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            if record.get("status") == "ok":
+                completed.add(record["path"])
+    return completed
+
+
+def _extract_job(path, compact=False):
+    """
+    Runs in a worker process. Returns (path, text, error) instead of raising;
+    with compact=True the text is a PreparedCV.
+    """
+    try:
+        if compact:
+            return path, prepare_cv(extract_pages(path)), None
+        return path, extract_text(path), None
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def _produce(paths, workers, text_queue, analysis_threads, cache=None, compact=False):
+    """Feeds extracted text into the queue, keeping only a small window of work in flight."""
+    workers = workers or os.cpu_count() or 1
+
+    def finish(key, future):
+        result = future.result()
+        if cache is not None and result[2] is None:
+            if compact:
+                # Keep the pre-compaction token count, so cache hits still report tokens_saved
+                text = json.dumps({"text": result[1].text, "original_tokens": result[1].original_tokens},
+                                  ensure_ascii=False)
+            else:
+                text = result[1]
+            cache.put(TEXT, key, text)
+        # put() blocks while the queue is full, which throttles extraction
+        text_queue.put(result)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            window = workers * 2
+            pending = deque()
+            for path in paths:
+                key = None
+                if cache is not None:
+                    # Compacted text is cached separately from the raw extraction, with its original token count
+                    key = file_sha256(path) + (":compact-tokens" if compact else "")
+                    text = cache.get(TEXT, key)
+                    if text is not None:
+                        if compact:
+                            entry = json.loads(text)
+                            # Chunking the compacted text again gives the same chunks; the raw token count comes from the entry
+                            text = prepare_cv(entry["text"])
+                            text.original_tokens = entry["original_tokens"]
+                        text_queue.put((path, text, None))
+                        continue
+                pending.append((key, pool.submit(_extract_job, path, compact)))
+                if len(pending) >= window:
+                    finish(*pending.popleft())
+            while pending:
+                finish(*pending.popleft())
+    finally:
+        # Always release the analysis threads, even if the pool broke
+        for _ in range(analysis_threads):
+            text_queue.put(_DONE)
+
+
+def _consume(text_queue, analyze, output, write_lock, totals):
+    """Analyses queued CV text and appends one JSON line per CV."""
+    while True:
+        item = text_queue.get()
+        if item is _DONE:
+            return
+
+        path, text, error = item
+        record = {"path": path, "status": "ok", "chars": 0, "analysis": None, "error": error}
+        if isinstance(text, PreparedCV):
+            record["prompt_tokens"] = text.prepared_tokens
+            record["tokens_saved"] = text.tokens_saved
+            record["chunks"] = len(text.chunks)
+        if error is None:
+            record["chars"] = len(text.text) if isinstance(text, PreparedCV) else len(text)
+            try:
+                record["analysis"] = analyze(text)
+            except Exception as e:
+                record["error"] = f"{type(e).__name__}: {e}"
+        if record["error"] is not None:
+            record["status"] = "error"
+
+        with write_lock:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            totals[record["status"]] += 1
+
+
+def run_batch(target, output_path, workers=None, queue_size=16, analysis_threads=1, analyze=analyze_cv,
+              cache=None, compact=False, structured=False):
+    """
+    Analyses every CV found by find_cv_files(target) and appends results to output_path.
+    workers: number of extraction processes (defaults to the CPU count)
+    queue_size: how many extracted CVs may wait for analysis before extraction pauses
+    analysis_threads: number of concurrent analyze() calls
+    cache: optional CVCache for extracted text and analyses
+    compact: preprocess CVs with preprocess.prepare_cv and map-reduce long ones
+    structured: record each analysis as a structured.CVAnalysis JSON object instead of text
+    Returns a dict with counts of ok, error and skipped CVs.
+    """
+    completed = load_completed(output_path)
+    found = find_cv_files(target)
+    paths = [path for path in found if path not in completed]
+    totals = {"ok": 0, "error": 0, "skipped": len(found) - len(paths)}
+    if not paths:
+        return totals
+
+    prompt_template = PROMPT_TEMPLATE
+    if structured:
+        # pydantic and google.genai are only loaded when structured output is requested
+        from structured import STRUCTURED_PROMPT_TEMPLATE, analyze_cv_structured
+
+        prompt_template = STRUCTURED_PROMPT_TEMPLATE
+        if analyze is analyze_cv:
+            # Kept as a JSON string so the cache stores it like any other analysis
+            analyze = lambda text: analyze_cv_structured(text).model_dump_json()
+
+    def analyze_payload(payload):
+        if isinstance(payload, PreparedCV):
+            text = payload.text
+            run = lambda _: analyze_prepared(payload, analyze)
+        else:
+            text, run = payload, analyze
+        if cache is not None:
+            result = cache.analysis_for(text, run, prompt_template)
+        else:
+            result = run(text)
+        return json.loads(result) if structured else result
+
+    text_queue = queue.Queue(maxsize=queue_size)
+    write_lock = threading.Lock()
+
+    with open(output_path, "a", encoding="utf-8") as output:
+        consumers = [
+            threading.Thread(target=_consume, args=(text_queue, analyze_payload, output, write_lock, totals))
+            for _ in range(analysis_threads)
+        ]
+        for consumer in consumers:
+            consumer.start()
+
+        _produce(paths, workers, text_queue, analysis_threads, cache, compact)
+
+        for consumer in consumers:
+            consumer.join()
+
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyse a directory or glob of CVs into a JSONL file.")
+    parser.add_argument("target", help="directory of CVs or a glob such as 'cvs/**/*.pdf'")
+    parser.add_argument("-o", "--output", default="results.jsonl", help="JSONL file to append results to")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="extraction processes (default: CPU count)")
+    parser.add_argument("-q", "--queue-size", type=int, default=16, help="max extracted CVs waiting for analysis")
+    parser.add_argument("-t", "--analysis-threads", type=int, default=1, help="concurrent Gemini calls")
+    parser.add_argument("--cache", metavar="PATH", help="SQLite cache of extracted text and analyses")
+    parser.add_argument("--compact", action="store_true", help="compact and chunk CV text before analysis")
+    parser.add_argument("--structured", action="store_true", help="request JSON analyses matching structured.CVAnalysis")
+    parser.add_argument("--results-db", metavar="PATH", help="load structured results into this SQLite store")
+    args = parser.parse_args()
+
+    cv_cache = CVCache(args.cache) if args.cache else None
+    start = time.perf_counter()
+    summary = run_batch(args.target, args.output, args.workers, args.queue_size, args.analysis_threads,
+                        cache=cv_cache, compact=args.compact, structured=args.structured)
+    elapsed = time.perf_counter() - start
+
+    print(f"Analysed {summary['ok']} CV(s), {summary['error']} error(s), "
+          f"{summary['skipped']} already done, in {elapsed:.1f}s")
+    print(f"Results written to {args.output}")
+    if cv_cache is not None:
+        report = cv_cache.stats()
+        print(f"Cache hits: text {report['text']['hits']}/{report['text']['hits'] + report['text']['misses']}, "
+              f"analysis {report['analysis']['hits']}/{report['analysis']['hits'] + report['analysis']['misses']}")
+        cv_cache.close()
+    if args.results_db:
+        from results_store import ResultsStore
+
+        store = ResultsStore(args.results_db)
+        totals = store.import_jsonl(args.output)
+        print(f"Stored {totals['imported']} structured result(s) in {args.results_db}, "
+              f"skipped {totals['skipped']} malformed record(s)")
+        store.close()
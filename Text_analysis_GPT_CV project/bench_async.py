@@ -0,0 +1,67 @@
+"""
+Measures CVs/second of AsyncCVAnalyzer against the local fake Gemini server.
+
+Each scenario starts a FakeGeminiServer with the given latency and throttling,
+then analyses the same batch of synthetic CVs at several concurrency limits.
+Concurrency 1 is the one-request-at-a-time baseline of main.analyze_cv.
+
+Usage:
+    python bench_async.py --cvs 200 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from async_analyzer import AsyncCVAnalyzer
+from fake_gemini_server import FakeGeminiServer
+from gemini_client import connection_stats
+
+SAMPLE_CV = (
+    "Jane Doe\nSoftware Engineer\n\nEXPERIENCE\n"
+    "Backend developer at Example Ltd, 2019-2024. Built Python services and SQL reports.\n\n"
+    "EDUCATION\nBSc Computer Science\n\nSKILLS\nPython, SQL, Docker, Data analysis\n"
+)
+
+
+async def run_scenario(name, cv_count, concurrency_levels, **server_options):
+    server = FakeGeminiServer(**server_options).start()
+    os.environ.setdefault("GEMINI_API_KEY", "fake-key")  # the fake server accepts any key
+    cvs = [f"{SAMPLE_CV}\nCandidate #{i}" for i in range(cv_count)]
+    print(f"\n{name} (latency={server.latency}s, throttle={server.throttle_rate:.0%}, "
+          f"errors={server.error_rate:.0%})")
+    print(f"{'concurrency':>11} {'seconds':>8} {'CVs/s':>8} {'retries':>8} {'failed':>7}")
+
+    try:
+        for concurrency in concurrency_levels:
+            analyzer = AsyncCVAnalyzer(base_url=server.url, max_concurrency=concurrency,
+                                       base_delay=0.05, max_delay=1.0)
+            start = time.perf_counter()
+            results = await analyzer.analyze_many(cvs)
+            elapsed = time.perf_counter() - start
+            failed = sum(isinstance(result, Exception) for result in results)
+            print(f"{concurrency:>11} {elapsed:>8.2f} {cv_count / elapsed:>8.1f} "
+                  f"{analyzer.stats['retries']:>8} {failed:>7}")
+    finally:
+        server.stop()
+
+
+async def main(args):
+    # One event loop for every scenario, so the shared client's connections stay usable
+    await run_scenario("Steady latency", args.cvs, args.concurrency, latency=args.latency, jitter=args.latency / 2)
+    await run_scenario("Throttled", args.cvs, args.concurrency, latency=args.latency, throttle_rate=0.2)
+    await run_scenario("Flaky backend", args.cvs, args.concurrency, latency=args.latency, error_rate=0.05)
+
+    reuse = connection_stats()
+    print(f"\nHTTP calls: {reuse['calls']}, new connections: {reuse['new_connections']}, "
+          f"reused: {reuse['reused_connections']} ({reuse['reuse_ratio']:.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark async CV analysis against a fake Gemini server.")
+    parser.add_argument("--cvs", type=int, default=100, help="number of CVs per run")
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated seconds per request")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,111 @@
+"""
+Compares the PDF extraction backends on resume-sample.pdf and synthetic long PDFs.
+
+For each document and backend it reports the time to the first page from the
+streaming generator, serial extraction time, and page-parallel extraction time.
+
+Usage:
+    python bench_extractors.py --pages 50 --documents 3
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from extractors import BACKENDS, extract_pdf_text, iter_pdf_pages
+
+SAMPLE_PDF = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume-sample.pdf")
+
+SYNTHETIC_LINES = [
+    "Senior Software Engineer - Example Ltd (2019 - 2024)",
+    "Designed Python microservices handling 2M requests per day.",
+    "Led migration of reporting from Excel to SQL and Power BI dashboards.",
+    "Mentored four junior developers and ran weekly code reviews.",
+    "Skills: Python, SQL, Docker, Kubernetes, AWS, Git, CI/CD, Agile",
+]
+
+
+def write_synthetic_pdf(path, pages=50, lines_per_page=48, title="Synthetic CV"):
+    """Writes a plain text-only PDF (Helvetica, no dependencies) with the given number of pages."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_numbers = []
+    for page in range(pages):
+        lines = [title] + [f"Page {page + 1}: {SYNTHETIC_LINES[(page + i) % len(SYNTHETIC_LINES)]}"
+                           for i in range(lines_per_page - 1)]
+        stream = "BT /F1 10 Tf 14 TL 50 800 Td " + " ".join(f"({line}) '" for line in lines) + " ET"
+        stream = stream.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_number = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_number
+        )
+        page_numbers.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % number for number in page_numbers)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)
+
+    with open(path, "wb") as pdf:
+        pdf.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(pdf.tell())
+            pdf.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+        xref_offset = pdf.tell()
+        pdf.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            pdf.write(b"%010d 00000 n \n" % offset)
+        pdf.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                  % (len(objects) + 1, xref_offset))
+
+
+def time_first_page(path, backend):
+    start = time.perf_counter()
+    next(iter_pdf_pages(path, backend), None)
+    return time.perf_counter() - start
+
+
+def time_extract(path, backend, workers):
+    start = time.perf_counter()
+    text = extract_pdf_text(path, backend, workers)
+    return time.perf_counter() - start, len(text)
+
+
+def bench(label, paths, workers):
+    print(f"\n{label}")
+    print(f"{'backend':<11} {'first page':>10} {'serial':>9} {'parallel':>9} {'chars':>9}")
+    for backend in BACKENDS:
+        first = serial = parallel = 0.0
+        chars = 0
+        for path in paths:
+            first += time_first_page(path, backend)
+            elapsed, chars = time_extract(path, backend, workers=1)
+            serial += elapsed
+            parallel += time_extract(path, backend, workers)[0]
+        count = len(paths)
+        print(f"{backend:<11} {first / count * 1000:>8.1f}ms {serial / count:>8.3f}s "
+              f"{parallel / count:>8.3f}s {chars:>9}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends.")
+    parser.add_argument("--pages", type=int, default=50, help="pages per synthetic PDF")
+    parser.add_argument("--documents", type=int, default=3, help="number of synthetic PDFs")
+    parser.add_argument("--workers", type=int, default=None, help="processes for parallel runs")
+    args = parser.parse_args()
+
+    if os.path.exists(SAMPLE_PDF):
+        bench("resume-sample.pdf (per document)", [SAMPLE_PDF], args.workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.documents):
+            path = os.path.join(tmp, f"synthetic_{i}.pdf")
+            write_synthetic_pdf(path, args.pages)
+            paths.append(path)
+        bench(f"Synthetic {args.pages}-page PDFs (mean of {args.documents})", paths, args.workers)
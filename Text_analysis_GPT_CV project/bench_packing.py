@@ -0,0 +1,74 @@
+"""
+Compares packed analysis (several CVs per call) with one call per CV, against
+the local fake Gemini server.
+
+The fake server answers packed prompts with a JSON array of per-CV analyses.
+--malformed-rate makes it drop entries, to show the cost of the single-CV
+fallback.
+
+Usage:
+    python bench_packing.py --cvs 100 --latency 0.3 --max-per-call 8
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+
+from fake_gemini_server import CANNED_ANALYSIS, FakeGeminiServer
+from main import analyze_cv
+from packing import DEFAULT_PACK_TOKEN_BUDGET, analyze_cvs_packed
+
+SHORT_CV = (
+    "Alex Smith\nData Analyst\n\nEXPERIENCE\n"
+    "Analyst at Example Bank, 2021-2024. Built SQL reports and Power BI dashboards.\n\n"
+    "EDUCATION\nBSc Statistics\n\nSKILLS\nSQL, Python, Excel, Power BI\n"
+)
+
+
+def make_responder(malformed_rate):
+    def respond(prompt):
+        ids = re.findall(r'<cv id="([^"]+)">', prompt)
+        if not ids:
+            return CANNED_ANALYSIS
+        entries = [{"id": cv_id, "analysis": CANNED_ANALYSIS} for cv_id in ids
+                   if random.random() >= malformed_rate]
+        return json.dumps(entries)
+    return respond
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark multi-CV request packing.")
+    parser.add_argument("--cvs", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated seconds per request")
+    parser.add_argument("--max-per-call", type=int, default=8)
+    parser.add_argument("--token-budget", type=int, default=DEFAULT_PACK_TOKEN_BUDGET)
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="fraction of packed entries dropped")
+    args = parser.parse_args()
+
+    server = FakeGeminiServer(latency=args.latency, responder=make_responder(args.malformed_rate)).start()
+    # get_client() reads this when the first call is made
+    os.environ["GEMINI_BASE_URL"] = server.url
+    os.environ.setdefault("GEMINI_API_KEY", "fake-key")  # the fake server accepts any key
+    cvs = [f"{SHORT_CV}\nCandidate #{i}" for i in range(args.cvs)]
+
+    try:
+        start = time.perf_counter()
+        for cv in cvs:
+            analyze_cv(cv)
+        single_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results, stats = analyze_cvs_packed(cvs, args.token_budget, args.max_per_call)
+        packed_seconds = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    assert all(results), "every CV should have an analysis"
+    print(f"{'mode':<14} {'calls':>6} {'seconds':>8} {'CVs/s':>7}")
+    print(f"{'one per CV':<14} {args.cvs:>6} {single_seconds:>8.2f} {args.cvs / single_seconds:>7.1f}")
+    print(f"{'packed':<14} {stats['calls']:>6} {packed_seconds:>8.2f} {args.cvs / packed_seconds:>7.1f}")
+    print(f"\nCalls saved: {stats['calls_saved']} ({stats['packed_calls']} packed, "
+          f"{stats['single_calls']} single, {stats['fallback_calls']} fallback)")
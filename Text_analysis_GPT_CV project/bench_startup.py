@@ -0,0 +1,75 @@
+"""
+Startup benchmark for the CV analyzer CLI, based on `python -X importtime`.
+
+For each scenario it runs a fresh interpreter several times and reports the
+median wall-clock time, plus the cumulative import time of the slowest
+top-level modules. Heavy dependencies are shown on their own for comparison,
+since main.py should only pay for them on the code path that needs them.
+
+Usage:
+    python bench_startup.py --runs 10
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SCENARIOS = [
+    ("import main", ["-c", "import main"], None),
+    ("CLI, missing file", ["main.py"], "no-such-cv.pdf\n"),
+    ("CLI, unsupported file", ["main.py"], "README.md\n"),
+    ("import docx", ["-c", "import docx"], None),
+    ("import pdfplumber", ["-c", "import pdfplumber"], None),
+    ("import pypdfium2", ["-c", "import pypdfium2"], None),
+    ("import google.genai", ["-c", "from google import genai"], None),
+]
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_once(args, stdin_text):
+    """Runs one interpreter with -X importtime; returns (wall seconds, importtime stderr)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        input=stdin_text, capture_output=True, text=True, cwd=HERE,
+    )
+    return time.perf_counter() - start, result.stderr
+
+
+def top_level_imports(stderr, limit=5):
+    """Returns the slowest top-level modules as (name, cumulative ms)."""
+    modules = []
+    for match in IMPORT_LINE.finditer(stderr):
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        # Top-level imports are indented by a single space in -X importtime output
+        if len(indent) == 1:
+            modules.append((name, cumulative / 1000))
+    return sorted(modules, key=lambda module: module[1], reverse=True)[:limit]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure CV analyzer startup time.")
+    parser.add_argument("--runs", type=int, default=5, help="interpreter runs per scenario")
+    args = parser.parse_args()
+
+    # An empty interpreter is the floor every scenario pays
+    baseline = statistics.median(run_once(["-c", "pass"], None)[0] for _ in range(args.runs))
+    print(f"Empty interpreter: {baseline * 1000:.0f} ms (median of {args.runs})\n")
+    print(f"{'scenario':<24} {'median':>8} {'over empty':>11}  slowest imports")
+
+    for name, scenario_args, stdin_text in SCENARIOS:
+        timings = []
+        stderr = ""
+        for _ in range(args.runs):
+            elapsed, stderr = run_once(scenario_args, stdin_text)
+            timings.append(elapsed)
+        median = statistics.median(timings)
+        slowest = ", ".join(f"{module} {ms:.0f}ms" for module, ms in top_level_imports(stderr, 3))
+        print(f"{name:<24} {median * 1000:>6.0f}ms {(median - baseline) * 1000:>9.0f}ms  {slowest}")
@@ -0,0 +1,203 @@
+"""
+Persistent, content-addressed cache for extracted CV text and analysis results.
+
+- Extracted text is keyed by the SHA-256 of the file's bytes, so a resubmitted
+  CV is not re-parsed even if it has a new name.
+- Analyses are keyed by the hash of (CV text, prompt template, model name,
+  system instruction), so changing any of those naturally misses the cache.
+
+Entries live in one SQLite file. Entries older than the TTL are treated as
+misses, and when the cache grows past max_bytes the least recently used
+entries are evicted. One CVCache may be shared between threads.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from main import MODEL_NAME, PROMPT_TEMPLATE, SYSTEM_INSTRUCTION, analyze_cv, extract_text
+
+DEFAULT_CACHE_PATH = "cv_cache.db"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL = 30 * 24 * 3600  # seconds
+
+TEXT = "text"
+ANALYSIS = "analysis"
+
+
+def file_sha256(file_path):
+    """Hashes a file in 1 MiB blocks, without reading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as data:
+        for block in iter(lambda: data.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def analysis_key(cv_text, prompt_template=PROMPT_TEMPLATE, model=MODEL_NAME, system_instruction=SYSTEM_INSTRUCTION):
+    """Cache key for an analysis: changes whenever the text, prompt, model or instruction changes."""
+    # JSON keeps the parts unambiguous, e.g. ("ab", "c") and ("a", "bc") hash differently
+    payload = json.dumps([cv_text, prompt_template, model, system_instruction], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CVCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        """
+        path: SQLite file holding the cache
+        max_bytes: approximate size budget; least recently used entries are evicted beyond it
+        ttl: seconds an entry stays valid (None keeps entries until evicted)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = {TEXT: 0, ANALYSIS: 0}
+        self.misses = {TEXT: 0, ANALYSIS: 0}
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entry (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entry_accessed ON cache_entry (accessed)")
+        self.conn.commit()
+        self._total_bytes = self._stored_bytes()
+
+    def _stored_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entry").fetchone()[0]
+
+    def get(self, kind, key):
+        """Returns the cached value, or None on a miss or an expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, created, size FROM cache_entry WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM cache_entry WHERE kind = ? AND key = ?", (kind, key))
+                self.conn.commit()
+                self._total_bytes -= row[2]
+                row = None
+
+            if row is None:
+                self.misses[kind] += 1
+                return None
+
+            self.conn.execute("UPDATE cache_entry SET accessed = ? WHERE kind = ? AND key = ?", (now, kind, key))
+            self.conn.commit()
+            self.hits[kind] += 1
+            return row[0]
+
+    def put(self, kind, key, value):
+        """Stores a value, then evicts least recently used entries if over budget."""
+        now = time.time()
+        size = len(key) + len(value.encode("utf-8"))
+        with self._lock:
+            old = self.conn.execute(
+                "SELECT size FROM cache_entry WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache_entry (kind, key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, key, value, size, now, now),
+            )
+            self.conn.commit()
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Deletes the oldest-accessed entries until the cache is back under 90% of its budget."""
+        # Another process may share the file, so start from the real size
+        self._total_bytes = self._stored_bytes()
+        target = self.max_bytes * 0.9
+        while self._total_bytes > target:
+            rows = self.conn.execute(
+                "SELECT kind, key, size FROM cache_entry ORDER BY accessed LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for kind, key, size in rows:
+                if self._total_bytes <= target:
+                    break
+                self.conn.execute("DELETE FROM cache_entry WHERE kind = ? AND key = ?", (kind, key))
+                self._total_bytes -= size
+            self.conn.commit()
+
+    def text_for(self, file_path, extract=extract_text):
+        """Returns the extracted text of a CV, running extract(file_path) only on a miss."""
+        key = file_sha256(file_path)
+        text = self.get(TEXT, key)
+        if text is None:
+            text = extract(file_path)
+            self.put(TEXT, key, text)
+        return text
+
+    def analysis_for(self, cv_text, analyze=analyze_cv, prompt_template=PROMPT_TEMPLATE):
+        """
+        Returns the analysis of the CV text, calling analyze(cv_text) only on a miss.
+        prompt_template must be the template analyze() uses, so different prompts never share entries.
+        """
+        key = analysis_key(cv_text, prompt_template)
+        analysis = self.get(ANALYSIS, key)
+        if analysis is None:
+            analysis = analyze(cv_text)
+            self.put(ANALYSIS, key, analysis)
+        return analysis
+
+    def stats(self):
+        """Hit/miss counters for this process, plus the number of entries and bytes stored."""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0]
+            report = {"entries": entries, "bytes": self._total_bytes}
+            for kind in (TEXT, ANALYSIS):
+                lookups = self.hits[kind] + self.misses[kind]
+                report[kind] = {
+                    "hits": self.hits[kind],
+                    "misses": self.misses[kind],
+                    "hit_ratio": self.hits[kind] / lookups if lookups else 0.0,
+                }
+            return report
+
+    def clear(self):
+        with self._lock:
+            self.conn.execute("DELETE FROM cache_entry")
+            self.conn.commit()
+            self._total_bytes = 0
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or clear the CV cache.")
+    parser.add_argument("action", choices=["stats", "clear"])
+    parser.add_argument("--path", default=DEFAULT_CACHE_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"No cache at {args.path}")
+    else:
+        cache = CVCache(args.path)
+        if args.action == "clear":
+            cache.clear()
+            print(f"Cleared {args.path}")
+        else:
+            report = cache.stats()
+            print(f"{report['entries']} entries, {report['bytes'] / 1024:.1f} KiB in {args.path}")
+        cache.close()
@@ -0,0 +1,158 @@
+"""
+A local stand-in for the Gemini REST API, for load tests and benchmarks.
+
+It answers any POST to ".../models/<model>:generateContent" with a canned
+analysis after a configurable delay, and can be told to throttle (HTTP 429)
+or fail (HTTP 500) a fraction of requests. Point a client at it with:
+
+    genai.Client(api_key="fake", http_options=types.HttpOptions(base_url=server.url))
+
+Usage:
+    python fake_gemini_server.py --port 8089 --latency 0.5 --throttle-rate 0.1
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED_ANALYSIS = (
+    "Experience fields: Software Engineering, Data Analytics.\n"
+    "Main areas of expertise: Backend development, Data analysis.\n"
+    "Suggested roles: Software Engineer, Data Analyst.\n"
+    "Recommendations:\n"
+    "- Quantify achievements.\n"
+    "- Group skills by category.\n"
+    "- Shorten the personal summary."
+)
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.2, jitter=0.0, throttle_rate=0.0, error_rate=0.0, responder=None):
+        """
+        latency: seconds to wait before answering each request
+        jitter: extra random delay of up to this many seconds
+        throttle_rate / error_rate: fraction of requests answered with 429 / 500
+        responder: optional function(prompt_text) -> reply text, replacing the canned analysis
+        """
+        super().__init__(("127.0.0.1", port), _FakeGeminiHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.responder = responder
+        self.stats = {"requests": 0, "ok": 0, "throttled": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key):
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats[key] += 1
+
+    def start(self):
+        """Serves requests on a background thread and returns self."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _FakeGeminiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server = self.server
+
+        if ":generateContent" not in self.path:
+            self._send_json(404, _error_body(404, "Not found", "NOT_FOUND"))
+            return
+
+        time.sleep(server.latency + random.uniform(0, server.jitter))
+
+        roll = random.random()
+        if roll < server.throttle_rate:
+            server.count("throttled")
+            self._send_json(429, _error_body(429, "Resource has been exhausted", "RESOURCE_EXHAUSTED"))
+            return
+        if roll < server.throttle_rate + server.error_rate:
+            server.count("errors")
+            self._send_json(500, _error_body(500, "Internal error", "INTERNAL"))
+            return
+
+        prompt = _prompt_text(body)
+        reply = server.responder(prompt) if server.responder else CANNED_ANALYSIS
+        server.count("ok")
+        self._send_json(200, {
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": reply}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {
+                "promptTokenCount": len(prompt) // 4,
+                "candidatesTokenCount": len(reply) // 4,
+                "totalTokenCount": (len(prompt) + len(reply)) // 4,
+            },
+            "modelVersion": "fake-gemini",
+        })
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output readable
+
+
+def _error_body(code, message, status):
+    return {"error": {"code": code, "message": message, "status": status}}
+
+
+def _prompt_text(body):
+    """Joins the text parts of the request's contents."""
+    try:
+        request = json.loads(body or b"{}")
+    except json.JSONDecodeError:
+        return ""
+    parts = []
+    for content in request.get("contents", []):
+        parts.extend(part.get("text", "") for part in content.get("parts", []))
+    return "\n".join(parts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a fake Gemini API server.")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay, seconds")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    args = parser.parse_args()
+
+    server = FakeGeminiServer(args.port, args.latency, args.jitter, args.throttle_rate, args.error_rate)
+    print(f"Fake Gemini API listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("Stats:", server.stats)
@@ -0,0 +1,171 @@
+"""
+Long-lived Gemini clients shared by every analysis in the process.
+
+Creating a genai.Client per CV pays for client construction plus a fresh
+TCP/TLS handshake on every call. get_client() instead hands out one client per
+API endpoint, backed by pooled keep-alive httpx connections:
+
+- the sync surface (client.models) is safe to share across threads;
+- the async surface (client.aio.models) is safe to share across tasks of one
+  event loop. Its connections belong to that loop, so use one long-running
+  loop rather than calling asyncio.run() per batch.
+
+Every call is traced at the connection level, and connection_stats() reports
+how many calls opened a new connection versus reusing a pooled one.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+import httpx
+from google import genai
+from google.genai import types
+
+# Connection pool sizing, shared by the sync and async transports
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY = 120.0  # seconds an idle connection stays in the pool
+
+
+class ConnectionStats:
+    """Thread-safe counters of new versus reused connections, plus the most recent calls."""
+
+    def __init__(self, history=100):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.recent = deque(maxlen=history)
+
+    def record(self, method, url, new_connection, connect_seconds):
+        with self._lock:
+            self.calls += 1
+            if new_connection:
+                self.new_connections += 1
+            else:
+                self.reused_connections += 1
+            self.recent.append({
+                "method": method,
+                "path": url.path,
+                "reused": not new_connection,
+                "connect_ms": round(connect_seconds * 1000, 2),
+            })
+
+    def snapshot(self):
+        """Returns the counters, reuse ratio and per-call records as a plain dict."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "reuse_ratio": self.reused_connections / self.calls if self.calls else 0.0,
+                "recent_calls": list(self.recent),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.calls = self.new_connections = self.reused_connections = 0
+            self.recent.clear()
+
+
+stats = ConnectionStats()
+
+
+class _ConnectionTrace:
+    """httpcore trace callback that notes whether the request had to open a connection."""
+
+    def __init__(self):
+        self.new_connection = False
+        self.connect_started = None
+        self.connect_seconds = 0.0
+
+    def on_event(self, event_name):
+        # TCP connect and TLS handshake only happen for connections not taken from the pool
+        if event_name == "connection.connect_tcp.started":
+            self.new_connection = True
+            self.connect_started = time.perf_counter()
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            self.connect_seconds = time.perf_counter() - self.connect_started
+
+    def __call__(self, event_name, info):
+        self.on_event(event_name)
+
+
+class _AsyncConnectionTrace(_ConnectionTrace):
+    async def __call__(self, event_name, info):
+        self.on_event(event_name)
+
+
+def _record_response(response):
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, _ConnectionTrace):
+        stats.record(response.request.method, response.request.url, trace.new_connection, trace.connect_seconds)
+
+
+def _trace_request(request):
+    request.extensions.setdefault("trace", _ConnectionTrace())
+
+
+async def _trace_request_async(request):
+    request.extensions.setdefault("trace", _AsyncConnectionTrace())
+
+
+async def _record_response_async(response):
+    _record_response(response)
+
+
+def _http_options(base_url=None):
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    return types.HttpOptions(
+        base_url=base_url,
+        client_args={
+            "limits": limits,
+            "event_hooks": {"request": [_trace_request], "response": [_record_response]},
+        },
+        async_client_args={
+            "limits": limits,
+            "event_hooks": {"request": [_trace_request_async], "response": [_record_response_async]},
+        },
+    )
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _api_key():
+    """The Gemini API key from the GEMINI_API_KEY environment variable; it is never kept in the code."""
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY is not set. Export your Gemini API key, "
+                           "e.g. export GEMINI_API_KEY=... (any value works against fake_gemini_server.py)")
+    return api_key
+
+
+def get_client(base_url=None):
+    """
+    Returns the shared genai.Client for base_url, creating it on first use.
+    Without base_url, the GEMINI_BASE_URL environment variable is used if set
+    (e.g. to point at fake_gemini_server.py), otherwise the public Gemini API.
+    Raises RuntimeError when GEMINI_API_KEY is not set.
+    """
+    base_url = base_url or os.environ.get("GEMINI_BASE_URL") or None
+    client = _clients.get(base_url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(base_url)
+            if client is None:
+                client = genai.Client(api_key=_api_key(), http_options=_http_options(base_url))
+                _clients[base_url] = client
+    return client
+
+
+def connection_stats():
+    """Connection reuse statistics for every call made through get_client() clients."""
+    return stats.snapshot()
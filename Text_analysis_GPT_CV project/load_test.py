@@ -0,0 +1,135 @@
+"""
+Load test for service.py against a stub model backend.
+
+Starts the fake Gemini server and the CV service in this process (or targets
+an already running service with --url), then keeps --clients concurrent
+clients uploading unique synthetic CVs and polling for their results for
+--duration seconds. Reports sustained CVs/second, p50/p95/p99 end-to-end
+latency and how often the queue pushed back with 503.
+
+Usage:
+    python load_test.py --clients 16 --duration 30 --latency 0.3
+"""
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+from bench_extractors import write_synthetic_pdf
+from fake_gemini_server import FakeGeminiServer
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LoadClient(threading.Thread):
+    def __init__(self, url, documents, deadline, poll_interval):
+        super().__init__(daemon=True)
+        target = urlparse(url)
+        self.conn = http.client.HTTPConnection(target.hostname, target.port, timeout=60)
+        self.documents = documents
+        self.deadline = deadline
+        self.poll_interval = poll_interval
+        self.latencies = []
+        self.failures = 0
+        self.rejections = 0
+
+    def request(self, method, path, body=None):
+        self.conn.request(method, path, body=body)
+        response = self.conn.getresponse()
+        return response.status, json.loads(response.read() or b"{}")
+
+    def run(self):
+        index = 0
+        while time.time() < self.deadline:
+            name, data = self.documents[index % len(self.documents)]
+            index += 1
+
+            start = time.perf_counter()
+            status, job = self.request("POST", f"/jobs?filename={name}", data)
+            if status == 503:
+                self.rejections += 1
+                time.sleep(self.poll_interval)
+                continue
+
+            while job.get("status") in ("queued", "running"):
+                time.sleep(self.poll_interval)
+                status, job = self.request("GET", f"/jobs/{job['id']}")
+            if job.get("status") == "done":
+                self.latencies.append(time.perf_counter() - start)
+            else:
+                self.failures += 1
+
+
+def make_documents(directory, count):
+    """Unique one-page CVs, so the service cache (if any) never short-circuits the test."""
+    documents = []
+    for i in range(count):
+        path = os.path.join(directory, f"cv_{i}.pdf")
+        write_synthetic_pdf(path, pages=1, lines_per_page=30, title=f"Candidate {i} - {time.time_ns()}")
+        with open(path, "rb") as pdf:
+            documents.append((f"cv_{i}.pdf", pdf.read()))
+    return documents
+
+
+def run_load(url, clients, duration, poll_interval, documents):
+    deadline = time.time() + duration
+    workers = [LoadClient(url, documents[i::clients] or documents, deadline, poll_interval) for i in range(clients)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for worker in workers for latency in worker.latencies]
+    print(f"Completed: {len(latencies)} CVs in {elapsed:.1f}s -> {len(latencies) / elapsed:.1f} CVs/s")
+    print(f"Failed: {sum(worker.failures for worker in workers)}, "
+          f"rejected with 503: {sum(worker.rejections for worker in workers)}")
+    if latencies:
+        print(f"Latency p50 {statistics.median(latencies) * 1000:.0f} ms, "
+              f"p95 {percentile(latencies, 0.95) * 1000:.0f} ms, "
+              f"p99 {percentile(latencies, 0.99) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the CV analysis service.")
+    parser.add_argument("--url", help="existing service to test; by default one is started here")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--duration", type=float, default=20, help="seconds to keep submitting")
+    parser.add_argument("--latency", type=float, default=0.3, help="stub model latency, seconds")
+    parser.add_argument("--workers", type=int, default=16, help="service analysis threads")
+    parser.add_argument("--queue-size", type=int, default=32, help="service job queue size")
+    parser.add_argument("--poll-interval", type=float, default=0.02, help="seconds between status polls")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cv_documents = make_documents(tmp, max(64, args.clients * 4))
+
+        if args.url:
+            run_load(args.url, args.clients, args.duration, args.poll_interval, cv_documents)
+        else:
+            from service import CVService, make_server
+
+            backend = FakeGeminiServer(latency=args.latency).start()
+            os.environ["GEMINI_BASE_URL"] = backend.url
+            os.environ.setdefault("GEMINI_API_KEY", "fake-key")  # the fake server accepts any key
+            cv_service = CVService(args.workers, args.queue_size)
+            http_server = make_server(cv_service, port=0)
+            threading.Thread(target=http_server.serve_forever, daemon=True).start()
+            try:
+                run_load(f"http://127.0.0.1:{http_server.server_address[1]}",
+                         args.clients, args.duration, args.poll_interval, cv_documents)
+                print("Service health:", json.dumps(cv_service.health()))
+            finally:
+                http_server.shutdown()
+                cv_service.close()
+                backend.stop()
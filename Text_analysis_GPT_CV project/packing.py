@@ -0,0 +1,149 @@
+"""
+Request packing: analyse several short CVs in a single Gemini call.
+
+Most CVs are one or two pages, so per-request overhead (round trip, queueing,
+system instruction) dominates their cost. analyze_cvs_packed() groups CVs
+under a token budget, sends each group as one structured prompt that asks for
+a JSON array with one analysis per CV id, and splits the response back into
+per-CV results. Any CV whose entry is missing or malformed is re-analysed on
+its own with analyze_cv, so packing never loses a result.
+"""
+
+import json
+import re
+
+from google.genai import types
+
+from gemini_client import get_client
+from main import MODEL_NAME, SYSTEM_INSTRUCTION, analyze_cv
+from preprocess import estimate_tokens
+
+# Estimated prompt tokens per packed call, and the most CVs one call may carry
+DEFAULT_PACK_TOKEN_BUDGET = 12000
+DEFAULT_MAX_PER_CALL = 8
+
+PACKED_PROMPT_TEMPLATE = """
+    You are an expert AI recruiter analyzing several candidates' CVs in IT, software engineering, data analytics and computer science fields.
+    Analyse each CV below independently. For each CV:
+
+    1. Identify and categorize the candidate's experience into fields (e.g., Software Engineering, Lecturer, Business, Finance).
+    2. Suggest the main two areas of the candidate's expertise and the most relevant job roles based on the experience.
+    3. Provide recommendations for improving the CV in three bullet points.
+
+    Respond with only a JSON array containing one object per CV, in the same order:
+    [{{"id": "<cv id>", "analysis": "<the full analysis as text>"}}]
+
+    {cvs}
+    """
+
+# Prompt text around each CV, counted against the budget
+_OVERHEAD_TOKENS = estimate_tokens(PACKED_PROMPT_TEMPLATE + SYSTEM_INSTRUCTION)
+
+
+def _cv_block(cv_id, cv_text):
+    return f'<cv id="{cv_id}">\n{cv_text}\n</cv>'
+
+
+def pack_cvs(cv_texts, token_budget=DEFAULT_PACK_TOKEN_BUDGET, max_per_call=DEFAULT_MAX_PER_CALL):
+    """
+    Groups CV indexes into packs whose prompt stays within token_budget.
+    A CV that alone exceeds the budget gets a pack of its own.
+    """
+    packs = []
+    current = []
+    used = _OVERHEAD_TOKENS
+    for index, text in enumerate(cv_texts):
+        tokens = estimate_tokens(_cv_block(index, text))
+        if current and (used + tokens > token_budget or len(current) >= max_per_call):
+            packs.append(current)
+            current = []
+            used = _OVERHEAD_TOKENS
+        current.append(index)
+        used += tokens
+    if current:
+        packs.append(current)
+    return packs
+
+
+def build_packed_prompt(cvs):
+    """cvs: list of (id, text) pairs."""
+    return PACKED_PROMPT_TEMPLATE.format(cvs="\n\n".join(_cv_block(cv_id, text) for cv_id, text in cvs))
+
+
+def parse_packed_response(response_text, expected_ids):
+    """
+    Returns {id: analysis} for every well-formed entry with an expected id.
+    Raises ValueError if the response is not a JSON array at all.
+    """
+    text = (response_text or "").strip()
+    # Tolerate a ```json fenced block around the array
+    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+
+    try:
+        entries = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Packed response is not valid JSON: {e}") from e
+    if not isinstance(entries, list):
+        raise ValueError("Packed response is not a JSON array")
+
+    expected = {str(cv_id) for cv_id in expected_ids}
+    results = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        cv_id = str(entry.get("id"))
+        analysis = entry.get("analysis")
+        if cv_id in expected and isinstance(analysis, str) and analysis.strip():
+            results[cv_id] = analysis
+    return results
+
+
+def _generate_packed(prompt):
+    response = get_client().models.generate_content(
+        model=MODEL_NAME,
+        config=types.GenerateContentConfig(
+            system_instruction=SYSTEM_INSTRUCTION,
+            response_mime_type="application/json",
+        ),
+        contents=prompt,
+    )
+    return response.text
+
+
+def analyze_cvs_packed(cv_texts, token_budget=DEFAULT_PACK_TOKEN_BUDGET, max_per_call=DEFAULT_MAX_PER_CALL,
+                       analyze=analyze_cv, generate=_generate_packed):
+    """
+    Analyses a list of CV texts with as few calls as the token budget allows.
+    Returns (results, stats): results are analysis texts in input order, and stats
+    counts packed calls, single-CV calls, fallback calls and calls saved versus one per CV.
+    """
+    results = [None] * len(cv_texts)
+    stats = {"cvs": len(cv_texts), "packed_calls": 0, "single_calls": 0, "fallback_calls": 0}
+
+    for pack in pack_cvs(cv_texts, token_budget, max_per_call):
+        if len(pack) == 1:
+            results[pack[0]] = analyze(cv_texts[pack[0]])
+            stats["single_calls"] += 1
+            continue
+
+        stats["packed_calls"] += 1
+        try:
+            parsed = parse_packed_response(
+                generate(build_packed_prompt([(index, cv_texts[index]) for index in pack])), pack
+            )
+        except ValueError:
+            parsed = {}
+
+        for index in pack:
+            if str(index) in parsed:
+                results[index] = parsed[str(index)]
+            else:
+                # Missing or malformed entry: fall back to a normal single-CV call
+                results[index] = analyze(cv_texts[index])
+                stats["fallback_calls"] += 1
+
+    stats["calls"] = stats["packed_calls"] + stats["single_calls"] + stats["fallback_calls"]
+    stats["calls_saved"] = len(cv_texts) - stats["calls"]
+    return results, stats
@@ -0,0 +1,214 @@
+"""
+Prompt compaction and chunking for CV text before it is sent to Gemini.
+
+prepare_cv() takes the text of each page and:
+1. normalises whitespace (runs of spaces, trailing spaces, stacks of blank lines);
+2. drops header/footer lines that repeat at the top or bottom of most pages,
+   e.g. the candidate's name or "Page 2 of 4";
+3. estimates tokens before and after, so savings can be reported per CV;
+4. splits CVs that are still over the token budget into chunks along section
+   headings (Experience, Education, Skills, ...).
+
+analyze_prepared() analyses short CVs in one call. Long CVs are map-reduced:
+each chunk is summarised, then the summaries are analysed together.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List
+
+from main import MODEL_NAME, SYSTEM_INSTRUCTION, analyze_cv
+
+# Prompts above this many (estimated) tokens are map-reduced
+DEFAULT_MAX_PROMPT_TOKENS = 6000
+
+# Lines this close to the top or bottom of a page are header/footer candidates
+EDGE_LINES = 3
+
+SECTION_HEADINGS = {
+    "summary", "profile", "professional summary", "objective", "career objective",
+    "experience", "work experience", "professional experience", "employment", "employment history",
+    "education", "qualifications", "skills", "technical skills", "key skills", "projects",
+    "certifications", "certificates", "training", "publications", "awards", "achievements",
+    "languages", "interests", "volunteering", "references",
+}
+
+CHUNK_PROMPT_TEMPLATE = """
+    Summarise this part of a candidate's CV for a recruiter. Keep every job title, employer,
+    date range, qualification and skill; drop filler wording.
+
+    CV Part {index} of {total}:
+    {chunk}
+    """
+
+
+def estimate_tokens(text):
+    """Rough token count for budgeting and rate limiting (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def normalize_whitespace(text):
+    """Collapses runs of spaces/tabs, strips line ends and keeps at most one blank line in a row."""
+    text = text.replace("\u00a0", " ").replace("\r\n", "\n").replace("\r", "\n")
+    text = re.sub(r"[ \t\f\v]+", " ", text)
+    text = re.sub(r" *\n *", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def _line_signature(line):
+    # Page numbers differ per page, so "Page 2 of 4" and "Page 3 of 4" must match
+    return re.sub(r"\d+", "#", line.strip().lower())
+
+
+def drop_repeated_edges(pages):
+    """
+    Removes lines that appear near the top or bottom of at least half of the pages.
+    Needs two or more pages; a single page is returned unchanged.
+    """
+    if len(pages) < 2:
+        return pages
+
+    page_lines = [page.split("\n") for page in pages]
+    seen = Counter()
+    for lines in page_lines:
+        edges = {_line_signature(line) for line in lines[:EDGE_LINES] + lines[-EDGE_LINES:] if line.strip()}
+        seen.update(edges)
+
+    repeated = {signature for signature, count in seen.items() if count >= max(2, len(pages) / 2)}
+    if not repeated:
+        return pages
+
+    cleaned = []
+    for lines in page_lines:
+        last = len(lines) - EDGE_LINES
+        kept = [
+            line for index, line in enumerate(lines)
+            if not ((index < EDGE_LINES or index >= last) and _line_signature(line) in repeated)
+        ]
+        cleaned.append("\n".join(kept))
+    return cleaned
+
+
+def _is_heading(line):
+    stripped = line.strip().rstrip(":").strip()
+    if not stripped or len(stripped) > 40:
+        return False
+    if stripped.lower() in SECTION_HEADINGS:
+        return True
+    # Short ALL-CAPS lines such as "WORK HISTORY" are headings in most CV templates
+    letters = [char for char in stripped if char.isalpha()]
+    return len(letters) >= 4 and all(char.isupper() for char in letters)
+
+
+def split_sections(text):
+    """Splits CV text into sections, each starting at a heading line."""
+    sections = []
+    current = []
+    for line in text.split("\n"):
+        if _is_heading(line) and current:
+            sections.append("\n".join(current).strip())
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current).strip())
+    return [section for section in sections if section]
+
+
+def _split_oversized(section, max_tokens):
+    """Splits one section that is over budget at paragraph, then line boundaries."""
+    for separator in ("\n\n", "\n"):
+        parts = section.split(separator)
+        if all(estimate_tokens(part) <= max_tokens for part in parts):
+            return _pack(parts, max_tokens, separator)
+    # A single enormous line: fall back to fixed-size slices
+    size = max_tokens * 4
+    return [section[start:start + size] for start in range(0, len(section), size)]
+
+
+def _pack(parts, max_tokens, separator):
+    """Greedily joins consecutive parts into chunks that stay within max_tokens."""
+    chunks = []
+    current = []
+    current_tokens = 0
+    for part in parts:
+        tokens = estimate_tokens(part)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(separator.join(current))
+            current = []
+            current_tokens = 0
+        current.append(part)
+        current_tokens += tokens
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+def chunk_cv(text, max_tokens=DEFAULT_MAX_PROMPT_TOKENS):
+    """Splits CV text into section-aligned chunks of at most max_tokens each."""
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    parts = []
+    for section in split_sections(text):
+        if estimate_tokens(section) > max_tokens:
+            parts.extend(_split_oversized(section, max_tokens))
+        else:
+            parts.append(section)
+    return _pack(parts, max_tokens, "\n\n")
+
+
+@dataclass
+class PreparedCV:
+    text: str
+    chunks: List[str] = field(default_factory=list)
+    original_tokens: int = 0
+    prepared_tokens: int = 0
+
+    @property
+    def tokens_saved(self):
+        return self.original_tokens - self.prepared_tokens
+
+
+def prepare_cv(pages, max_tokens=DEFAULT_MAX_PROMPT_TOKENS):
+    """
+    Compacts CV text and splits it into chunks if it is still too long.
+    pages: list of page texts (a plain string is treated as a single page)
+    """
+    if isinstance(pages, str):
+        pages = [pages]
+
+    original_tokens = estimate_tokens("\n".join(pages))
+    pages = drop_repeated_edges([normalize_whitespace(page) for page in pages])
+    text = normalize_whitespace("\n".join(pages))
+
+    return PreparedCV(
+        text=text,
+        chunks=chunk_cv(text, max_tokens),
+        original_tokens=original_tokens,
+        prepared_tokens=estimate_tokens(text),
+    )
+
+
+def summarize_chunk(chunk, index, total):
+    """Map step: condenses one chunk of a long CV."""
+    from google.genai import types
+    from gemini_client import get_client
+
+    response = get_client().models.generate_content(
+        model=MODEL_NAME,
+        config=types.GenerateContentConfig(system_instruction=SYSTEM_INSTRUCTION),
+        contents=CHUNK_PROMPT_TEMPLATE.format(index=index, total=total, chunk=chunk),
+    )
+    return response.text
+
+
+def analyze_prepared(prepared, analyze=analyze_cv, summarize=summarize_chunk):
+    """Analyses a PreparedCV, map-reducing over its chunks when there is more than one."""
+    if len(prepared.chunks) <= 1:
+        return analyze(prepared.text)
+
+    total = len(prepared.chunks)
+    summaries = [summarize(chunk, index, total) for index, chunk in enumerate(prepared.chunks, start=1)]
+    return analyze("\n\n".join(summaries))
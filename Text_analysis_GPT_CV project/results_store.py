@@ -0,0 +1,165 @@
+"""
+SQLite store for structured CV analyses.
+
+Roles and expertise areas get their own indexed tables, so questions like
+"which CVs suit a Data Analyst role?" are index lookups instead of a
+re-analysis of the corpus. Matching is case-insensitive.
+
+Usage:
+    python results_store.py --db cv_results.db import results.jsonl
+    python results_store.py --db cv_results.db find --role "Data Analyst"
+    python results_store.py --db cv_results.db find --expertise "Data analysis"
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from itertools import islice
+
+from pydantic import ValidationError
+
+from structured import CVAnalysis
+
+DEFAULT_RESULTS_PATH = "cv_results.db"
+
+# Rows written per executemany batch
+WRITE_BATCH_SIZE = 1000
+
+
+class ResultsStore:
+    def __init__(self, path=DEFAULT_RESULTS_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS cv_result (
+                cv_path TEXT PRIMARY KEY,
+                analysis_json TEXT NOT NULL,
+                analyzed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS cv_role (
+                cv_path TEXT NOT NULL,
+                role TEXT NOT NULL COLLATE NOCASE
+            );
+            CREATE TABLE IF NOT EXISTS cv_expertise (
+                cv_path TEXT NOT NULL,
+                rank INTEGER NOT NULL,
+                area TEXT NOT NULL COLLATE NOCASE
+            );
+            CREATE INDEX IF NOT EXISTS idx_cv_role_role ON cv_role (role);
+            CREATE INDEX IF NOT EXISTS idx_cv_role_path ON cv_role (cv_path);
+            CREATE INDEX IF NOT EXISTS idx_cv_expertise_area ON cv_expertise (area);
+            CREATE INDEX IF NOT EXISTS idx_cv_expertise_path ON cv_expertise (cv_path);
+        """)
+        self.conn.commit()
+
+    def save_many(self, records):
+        """
+        Writes (cv_path, CVAnalysis) pairs in batched transactions, replacing earlier
+        results for the same path. Accepts any iterable, so large imports stream.
+        Returns the number of results written.
+        """
+        records = iter(records)
+        written = 0
+        while True:
+            batch = list(islice(records, WRITE_BATCH_SIZE))
+            if not batch:
+                return written
+
+            now = time.time()
+            paths = [(path,) for path, _ in batch]
+            with self.conn:  # one transaction per batch
+                self.conn.executemany("DELETE FROM cv_role WHERE cv_path = ?", paths)
+                self.conn.executemany("DELETE FROM cv_expertise WHERE cv_path = ?", paths)
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO cv_result (cv_path, analysis_json, analyzed_at) VALUES (?, ?, ?)",
+                    [(path, analysis.model_dump_json(), now) for path, analysis in batch],
+                )
+                self.conn.executemany(
+                    "INSERT INTO cv_role (cv_path, role) VALUES (?, ?)",
+                    [(path, role.strip()) for path, analysis in batch for role in analysis.suggested_roles],
+                )
+                self.conn.executemany(
+                    "INSERT INTO cv_expertise (cv_path, rank, area) VALUES (?, ?, ?)",
+                    [(path, rank, area.strip()) for path, analysis in batch
+                     for rank, area in enumerate(analysis.expertise_areas, start=1)],
+                )
+            written += len(batch)
+
+    def import_jsonl(self, jsonl_path):
+        """
+        Loads the successful structured records of a batch.py --structured output file.
+        Malformed lines, and ok records without a path or a valid analysis, are skipped
+        rather than aborting the import. Returns a dict with counts of imported and skipped records.
+        """
+        totals = {"imported": 0, "skipped": 0}
+
+        def records():
+            with open(jsonl_path, "r", encoding="utf-8") as results:
+                for line in results:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        if record.get("status") != "ok":
+                            continue  # failed analyses have nothing to store
+                        path, analysis = record["path"], CVAnalysis.model_validate(record["analysis"])
+                    except (json.JSONDecodeError, AttributeError, KeyError, ValidationError):
+                        totals["skipped"] += 1
+                        continue
+                    yield path, analysis
+
+        totals["imported"] = self.save_many(records())
+        return totals
+
+    def _find(self, sql, value):
+        rows = self.conn.execute(sql, (value.strip(),)).fetchall()
+        return [(path, CVAnalysis.model_validate_json(analysis_json)) for path, analysis_json in rows]
+
+    def find_by_role(self, role):
+        """Returns (cv_path, CVAnalysis) for every CV suggested for the role."""
+        return self._find("""
+            SELECT DISTINCT r.cv_path, r.analysis_json
+            FROM cv_role cr
+            JOIN cv_result r ON r.cv_path = cr.cv_path
+            WHERE cr.role = ?
+            ORDER BY r.cv_path
+        """, role)
+
+    def find_by_expertise(self, area, top_only=False):
+        """Returns (cv_path, CVAnalysis) for CVs with the expertise area (only the strongest if top_only)."""
+        return self._find(f"""
+            SELECT DISTINCT r.cv_path, r.analysis_json
+            FROM cv_expertise ce
+            JOIN cv_result r ON r.cv_path = ce.cv_path
+            WHERE ce.area = ? {"AND ce.rank = 1" if top_only else ""}
+            ORDER BY r.cv_path
+        """, area)
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load and query structured CV analyses.")
+    parser.add_argument("--db", default=DEFAULT_RESULTS_PATH, help="results database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="load a batch.py --structured JSONL file")
+    import_parser.add_argument("jsonl")
+    find_parser = commands.add_parser("find", help="list CVs by suggested role or expertise area")
+    find_group = find_parser.add_mutually_exclusive_group(required=True)
+    find_group.add_argument("--role")
+    find_group.add_argument("--expertise")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.db)
+    if args.command == "import":
+        totals = store.import_jsonl(args.jsonl)
+        print(f"Imported {totals['imported']} result(s) into {args.db}, skipped {totals['skipped']} malformed record(s)")
+    else:
+        matches = store.find_by_role(args.role) if args.role else store.find_by_expertise(args.expertise)
+        for path, analysis in matches:
+            print(f"{path}: {', '.join(analysis.suggested_roles)}")
+        print(f"{len(matches)} CV(s) found")
+    store.close()
@@ -0,0 +1,304 @@
+"""
+Long-running CV analysis service.
+
+Keeps one interpreter, one pooled Gemini client, one extraction process pool
+and (optionally) the CV cache warm between requests, instead of paying for
+imports and client setup on every CLI run.
+
+Endpoints:
+    POST /jobs?filename=cv.pdf    upload a CV as the raw request body -> 202 {"id": ...}
+                                  503 with Retry-After when the job queue is full
+                                  411 without Content-Length, 400 if it is not a valid
+                                  size, 413 above --max-upload-mb
+    GET  /jobs/<id>               job status
+    GET  /jobs/<id>/result        analysis once the job is done (409 before that)
+    GET  /health                  queue depth, job counts, cache and connection stats
+
+Usage:
+    python service.py --port 8000 --workers 8 --queue-size 64 --cache cv_cache.db
+    curl --data-binary @resume-sample.pdf "http://localhost:8000/jobs?filename=resume-sample.pdf"
+"""
+
+import argparse
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from main import EXTRACTORS, analyze_cv, extract_text
+
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+
+# Jobs kept in memory for status/result lookups; the oldest finished ones are dropped beyond this
+MAX_RETAINED_JOBS = 10000
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "error"
+
+
+class Job:
+    def __init__(self, filename, upload_dir):
+        self.id = uuid.uuid4().hex
+        self.filename = os.path.basename(filename)
+        self.path = os.path.join(upload_dir, self.id + os.path.splitext(filename)[1].lower())
+        self.status = QUEUED
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "error": self.error,
+        }
+
+
+class CVService:
+    def __init__(self, workers=4, queue_size=64, extract_workers=None, cache=None, analyze=analyze_cv):
+        """
+        workers: threads running analyses (each waits on Gemini most of the time)
+        queue_size: jobs allowed to wait before new uploads are rejected
+        extract_workers: processes for PDF/DOCX extraction (defaults to the CPU count)
+        cache: optional cache.CVCache shared by all jobs
+        """
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.cache = cache
+        self.analyze = analyze
+        self.jobs = OrderedDict()
+        self.jobs_lock = threading.Lock()
+        self.counts = {"submitted": 0, "rejected": 0, DONE: 0, FAILED: 0}
+        self.upload_dir = tempfile.mkdtemp(prefix="cv_service_")
+        # pdfium is not thread-safe, so extraction runs in processes that stay warm between jobs
+        self.extract_pool = ProcessPoolExecutor(max_workers=extract_workers)
+        self.workers = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+        # Pay for the SDK import and client construction now, not on the first upload
+        from gemini_client import get_client
+
+        get_client()
+
+    def submit(self, filename, data):
+        """Queues an uploaded CV. Returns the Job, or None if the queue is full."""
+        if os.path.splitext(filename)[1].lower() not in EXTRACTORS:
+            raise ValueError(f"Unsupported file format: {filename}")
+
+        job = Job(filename, self.upload_dir)
+        with open(job.path, "wb") as upload:
+            upload.write(data)
+
+        with self.jobs_lock:
+            self.jobs[job.id] = job
+        try:
+            self.queue.put_nowait(job)
+        except queue.Full:
+            os.remove(job.path)
+            with self.jobs_lock:
+                del self.jobs[job.id]
+                self.counts["rejected"] += 1
+            return None
+
+        with self.jobs_lock:
+            self.counts["submitted"] += 1
+        return job
+
+    def get(self, job_id):
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def _extract(self, path):
+        if self.cache is not None:
+            return self.cache.text_for(path, lambda p: self.extract_pool.submit(extract_text, p).result())
+        return self.extract_pool.submit(extract_text, path).result()
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            job.status = RUNNING
+            job.started = time.time()
+            try:
+                text = self._extract(job.path)
+                if self.cache is not None:
+                    job.result = self.cache.analysis_for(text, self.analyze)
+                else:
+                    job.result = self.analyze(text)
+                job.status = DONE
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+                job.status = FAILED
+            finally:
+                job.finished = time.time()
+                os.remove(job.path)
+                self._finish(job)
+
+    def _finish(self, job):
+        with self.jobs_lock:
+            self.counts[job.status] += 1
+            # Jobs are kept in submission order, so the oldest finished ones come first
+            while len(self.jobs) > MAX_RETAINED_JOBS:
+                oldest_id, oldest = next(iter(self.jobs.items()))
+                if oldest.status not in (DONE, FAILED):
+                    break
+                del self.jobs[oldest_id]
+
+    def health(self):
+        from gemini_client import connection_stats
+
+        with self.jobs_lock:
+            report = {"queued": self.queue.qsize(), "workers": len(self.workers), **self.counts}
+        if self.cache is not None:
+            report["cache"] = self.cache.stats()
+        reuse = connection_stats()
+        report["connections"] = {key: reuse[key] for key in ("calls", "new_connections", "reused_connections")}
+        return report
+
+    def close(self):
+        for _ in self.workers:
+            self.queue.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.extract_pool.shutdown()
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        length = self._content_length()
+        if length is None:
+            return
+        data = self.rfile.read(length)
+
+        filename = parse_qs(url.query).get("filename", [self.headers.get("X-Filename", "")])[0]
+        try:
+            job = self.server.service.submit(filename, data)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        if job is None:
+            self._send_json(503, {"error": "Job queue is full, retry later"}, {"Retry-After": "1"})
+            return
+        self._send_json(202, job.to_dict(), {"Location": f"/jobs/{job.id}"})
+
+    def _content_length(self):
+        """The upload size from Content-Length, or None after answering 411 / 400 / 413."""
+        header = self.headers.get("Content-Length")
+        if header is None:
+            status, error = 411, "Content-Length header required"
+        else:
+            try:
+                length = int(header)
+            except ValueError:
+                length = -1
+            max_bytes = self.server.max_upload_bytes
+            if length < 0:
+                status, error = 400, f"Invalid Content-Length: {header!r}"
+            elif length > max_bytes:
+                status, error = 413, f"Upload larger than {max_bytes} bytes"
+            else:
+                return length
+        # The body is left unread, so this connection cannot be reused
+        self.close_connection = True
+        self._send_json(status, {"error": error}, {"Connection": "close"})
+        return None
+
+    def do_GET(self):
+        parts = [part for part in urlparse(self.path).path.split("/") if part]
+        service = self.server.service
+
+        if parts == ["health"]:
+            self._send_json(200, service.health())
+            return
+        if len(parts) not in (2, 3) or parts[0] != "jobs" or (len(parts) == 3 and parts[2] != "result"):
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        job = service.get(parts[1])
+        if job is None:
+            self._send_json(404, {"error": "Unknown job"})
+        elif len(parts) == 2:
+            self._send_json(200, job.to_dict())
+        elif job.status == DONE:
+            self._send_json(200, {"id": job.id, "analysis": job.result})
+        elif job.status == FAILED:
+            self._send_json(500, {"id": job.id, "error": job.error})
+        else:
+            self._send_json(409, {"id": job.id, "status": job.status, "error": "Job not finished"})
+
+    def _send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # one line per poll would drown the console under load
+
+
+def make_server(service, host="127.0.0.1", port=8000, max_upload_bytes=MAX_UPLOAD_BYTES):
+    server = ThreadingHTTPServer((host, port), _ServiceHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.max_upload_bytes = max_upload_bytes
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the CV analysis HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=8, help="concurrent analyses")
+    parser.add_argument("--queue-size", type=int, default=64, help="jobs waiting before uploads get 503")
+    parser.add_argument("--extract-workers", type=int, default=None, help="extraction processes")
+    parser.add_argument("--cache", metavar="PATH", help="SQLite cache of extracted text and analyses")
+    parser.add_argument("--max-upload-mb", type=float, default=MAX_UPLOAD_BYTES / (1024 * 1024),
+                        help="larger uploads get 413")
+    args = parser.parse_args()
+
+    cv_cache = None
+    if args.cache:
+        from cache import CVCache
+
+        cv_cache = CVCache(args.cache)
+
+    cv_service = CVService(args.workers, args.queue_size, args.extract_workers, cv_cache)
+    http_server = make_server(cv_service, args.host, args.port, int(args.max_upload_mb * 1024 * 1024))
+    print(f"CV analysis service listening on http://{args.host}:{args.port}")
+    try:
+        http_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http_server.server_close()
+        cv_service.close()
+        if cv_cache is not None:
+            cv_cache.close()
@@ -0,0 +1,55 @@
+"""
+Structured CV analysis: Gemini returns JSON that matches a response schema,
+parsed into a typed CVAnalysis object instead of free text.
+"""
+
+from typing import List
+
+from google.genai import types
+from pydantic import BaseModel, Field
+
+from gemini_client import get_client
+from main import MODEL_NAME, SYSTEM_INSTRUCTION
+
+STRUCTURED_PROMPT_TEMPLATE = """
+    You are an expert AI recruiter analyzing a candidate's CV in IT, software engineering, data analytics and computer science fields.
+
+    1. Identify and categorize the candidate's experience into fields (e.g., Software Engineering, Lecturer, Business, Finance).
+    2. Suggest the main two areas of the candidate's expertise and the most relevant job roles based on the experience.
+    3. Provide recommendations for improving the CV in three bullet points.
+
+    Answer using the JSON response schema. Use short, conventional job titles for roles (e.g., Data Analyst).
+
+    CV Text:
+    {cv_text}
+    """
+
+
+class CVAnalysis(BaseModel):
+    experience_fields: List[str] = Field(
+        description="Fields the candidate's experience falls into, e.g. Software Engineering, Finance")
+    expertise_areas: List[str] = Field(
+        min_length=2, max_length=2,
+        description="The candidate's two main areas of expertise, strongest first")
+    suggested_roles: List[str] = Field(
+        description="Most relevant job titles for the candidate, e.g. Data Analyst")
+    recommendations: List[str] = Field(
+        min_length=3, max_length=3,
+        description="Exactly three recommendations for improving the CV")
+
+
+def analyze_cv_structured(cv_text):
+    """Sends CV text to Gemini with a response schema and returns a CVAnalysis."""
+    response = get_client().models.generate_content(
+        model=MODEL_NAME,
+        config=types.GenerateContentConfig(
+            system_instruction=SYSTEM_INSTRUCTION,
+            response_mime_type="application/json",
+            response_schema=CVAnalysis,
+        ),
+        contents=STRUCTURED_PROMPT_TEMPLATE.format(cv_text=cv_text),
+    )
+    if isinstance(response.parsed, CVAnalysis):
+        return response.parsed
+    # parsed is None when the SDK could not validate the JSON; this raises a clear error instead
+    return CVAnalysis.model_validate_json(response.text or "")